@@ -1,42 +1,67 @@
 #!/usr/bin/env python3
 """
 Basic test runner for fixed functionality
+
+Install the optional test plugins for parallel and forked runs with:
+    pip install -e '.[test]'
 """
 
-import subprocess
+import argparse
+import importlib.util
 import sys
 import os
+import tempfile
+
+import pytest
+
+from run_tests import SCRIPT_DIR, junit_results
+
+# Tests that should pass
+BASIC_TESTS = (
+    "tests/unit/test_core_operations.py::TestSmartsheetOperations::test_initialization",
+    "tests/unit/test_core_operations.py::TestSmartsheetOperations::test_initialization_with_invalid_api_key",
+    "tests/unit/test_core_operations.py::TestBasicOperations::test_get_sheet_info_success",
+    "tests/unit/test_core_operations.py::TestBasicOperations::test_get_sheet_info_input_validation",
+    "tests/unit/test_core_operations.py::TestBasicOperations::test_get_sheet_info_invalid_sheet_id",
+)
+
+# Node ids are anchored to this directory rather than the process CWD
+BASIC_TEST_NODE_IDS = tuple(os.path.join(SCRIPT_DIR, node) for node in BASIC_TESTS)
 
-def run_tests():
+def plugin_args(isolate=False):
+    """Extra pytest arguments for whichever test extras are installed"""
+    args = []
+    if importlib.util.find_spec("xdist"):
+        args += ["-n", "auto"]
+    if isolate and importlib.util.find_spec("pytest_forked"):
+        # Fork every test, not just the ones conftest.py marks as forked
+        args.append("--forked")
+    return args
+
+def run_tests(fast=False, isolate=False):
     """Run basic tests that should work"""
     print("🧪 Running Basic Fixed Tests")
     print("=" * 50)
     
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Tests that should pass
-    basic_tests = [
-        "tests/unit/test_core_operations.py::TestSmartsheetOperations::test_initialization",
-        "tests/unit/test_core_operations.py::TestSmartsheetOperations::test_initialization_with_invalid_api_key",
-        "tests/unit/test_core_operations.py::TestBasicOperations::test_get_sheet_info_success",
-        "tests/unit/test_core_operations.py::TestBasicOperations::test_get_sheet_info_input_validation",
-        "tests/unit/test_core_operations.py::TestBasicOperations::test_get_sheet_info_invalid_sheet_id",
-    ]
-    
-    cmd = f"python -m pytest {' '.join(basic_tests)} -v --tb=short"
-    print(f"Running: {cmd}")
+    args = ["-v", "--tb=short", f"--rootdir={SCRIPT_DIR}", *plugin_args(isolate), *BASIC_TEST_NODE_IDS]
+    if fast:
+        # Only rerun last-failed tests, tracked in .pytest_cache/
+        args += ["--lf", "--last-failed-no-failures=all"]
+    print(f"Running: pytest {' '.join(args)}")
     print("-" * 50)
     
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            junit_path = os.path.join(tmp_dir, "results.xml")
+            # Run in this interpreter so pytest and conftest are only loaded once
+            rc = pytest.main([*args, f"--junitxml={junit_path}"])
+            case_results = junit_results(junit_path)
+        
+        passed = sum(1 for ok in case_results.values() if ok)
+        print(f"\nTests: {len(case_results)}, Passed: {passed}, Failed: {len(case_results) - passed}")
         
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr and "PytestDeprecationWarning" not in result.stderr:
-            print("STDERR:", result.stderr)
-            
-        success = result.returncode == 0
-        print(f"\n{'🎉 SUCCESS' if success else '❌ FAILED'}: Return code {result.returncode}")
+        success = rc == 0
+        print(f"\n{'🎉 SUCCESS' if success else '❌ FAILED'}: Return code {int(rc)}")
         return success
         
     except Exception as e:
@@ -44,7 +69,13 @@ def run_tests():
         return False
 
 if __name__ == "__main__":
-    success = run_tests()
+    parser = argparse.ArgumentParser(description='Basic test runner')
+    parser.add_argument('--fast', action='store_true',
+                        help='Only rerun tests that failed last time (all tests if none failed)')
+    parser.add_argument('--isolate', action='store_true',
+                        help='Run every test in a forked subprocess (needs pytest-forked)')
+    cli_args = parser.parse_args()
+    success = run_tests(fast=cli_args.fast, isolate=cli_args.isolate)
     
     print("\n" + "=" * 50)
     if success:
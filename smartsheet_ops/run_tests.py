@@ -1,66 +1,156 @@
 #!/usr/bin/env python3
 """
 Simple test runner for smartsheet_ops tests
+
+Install the optional test plugins for parallel and forked runs with:
+    pip install -e '.[test]'
 """
 
+import argparse
+import compileall
+import importlib.util
 import subprocess
 import sys
 import os
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def run_command(cmd, description):
-    """Run a command and return the result"""
+# All unit tests run in one pytest session; the initialization tests
+# live under tests/unit/ as well, so the directory covers them.
+UNIT_TEST_NODES = (
+    "tests/unit/",
+)
+
+def run_command(argv, description):
+    """Run a command (as an argv list, no shell) and return the result"""
     print(f"\n🔄 {description}")
-    print(f"Running: {cmd}")
+    print(f"Running: {' '.join(argv)}")
     print("-" * 50)
     
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
+        # Stream output line by line as the child produces it
+        proc = subprocess.Popen(
+            argv,
+            cwd=SCRIPT_DIR,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        returncode = proc.wait()
             
-        print(f"Return code: {result.returncode}")
-        return result.returncode == 0
+        print(f"Return code: {returncode}")
+        return returncode == 0
         
     except Exception as e:
         print(f"❌ Error running command: {e}")
         return False
 
+def worker_count():
+    """Number of xdist workers, leaving two cores free for the driver process"""
+    return max(1, (os.cpu_count() or 1) - 2)
+
+def plugin_args(isolate=False):
+    """Extra pytest arguments for whichever test extras are installed"""
+    args = []
+    if importlib.util.find_spec("xdist"):
+        args += ["-n", str(worker_count())]
+    if isolate and importlib.util.find_spec("pytest_forked"):
+        # Fork every test, not just the ones conftest.py marks as forked
+        args.append("--forked")
+    return args
+
+def junit_results(xml_path):
+    """Map each test case in a JUnit XML report to whether it passed"""
+    results = {}
+    try:
+        # Stream the report and drop each test case once read, so memory
+        # stays flat however many tests ran
+        for _, elem in ET.iterparse(xml_path, events=("end",)):
+            if elem.tag == "testcase":
+                key = f"{elem.get('classname')}.{elem.get('name')}"
+                results[key] = not any(child.tag in ("failure", "error") for child in elem)
+                elem.clear()
+    except (OSError, ET.ParseError):
+        pass
+    return results
+
+def group_passed(results, prefix, session_ok):
+    """Check the test cases under a dotted prefix, e.g. tests.unit.test_x.TestY"""
+    matched = [ok for key, ok in results.items() if key == prefix or key.startswith(prefix + ".")]
+    if not matched:
+        # Nothing ran for this group (deselected or never collected)
+        return session_ok
+    return all(matched)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Smartsheet Operations Test Runner')
+    parser.add_argument('--fast', action='store_true',
+                        help='Only rerun tests that failed last time (all tests if none failed)')
+    parser.add_argument('--isolate', action='store_true',
+                        help='Run every test in a forked subprocess (needs pytest-forked)')
+    return parser.parse_args()
+
 def main():
     """Main test runner"""
+    args = parse_args()
+    
     print("🧪 Smartsheet Operations Test Runner")
     print("=" * 50)
     
-    # Change to the correct directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    if args.fast:
+        # pytest keeps last-failed state in .pytest_cache/ next to pytest.ini
+        success = run_command(
+            [sys.executable, "-m", "pytest", *UNIT_TEST_NODES, *plugin_args(args.isolate),
+             "--lf", "--last-failed-no-failures=all", "-v", "--tb=short"],
+            "Rerun last-failed unit tests"
+        )
+        return 0 if success else 1
     
-    # Test configurations
-    test_configs = [
-        {
-            "cmd": "python -m pytest tests/unit/test_core_operations.py::TestSmartsheetOperations::test_initialization -v",
-            "description": "Test basic initialization (should pass)"
-        },
-        {
-            "cmd": "python -m pytest tests/unit/test_core_operations.py::TestSmartsheetOperations::test_initialization_with_invalid_api_key -v",
-            "description": "Test initialization with invalid key (should pass)"
-        },
-        {
-            "cmd": "python -m pytest tests/unit/ --tb=short -x",
-            "description": "Run all unit tests (stop on first failure)"
-        },
-        {
-            "cmd": "python -c 'from smartsheet_ops import SmartsheetOperations; print(\"✅ Import successful\")'",
-            "description": "Test basic import"
-        }
+    # Per-description summary, reconstructed from the session's JUnit report
+    summary_groups = [
+        ("tests.unit.test_core_operations.TestSmartsheetOperations.test_initialization",
+         "Test basic initialization (should pass)"),
+        ("tests.unit.test_core_operations.TestSmartsheetOperations.test_initialization_with_invalid_api_key",
+         "Test initialization with invalid key (should pass)"),
+        ("tests.unit",
+         "Run all unit tests (stop on first failure)"),
     ]
     
-    # Run tests
+    # Warm the bytecode cache so the child interpreters don't each compile
+    # the package on first import
+    compileall.compile_dir(os.path.join(SCRIPT_DIR, "smartsheet_ops"), quiet=1)
+    
+    # The pytest session and the import check are independent, so run them
+    # side by side; both just wait on a child process.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        junit_path = os.path.join(tmp_dir, "results.xml")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            session = executor.submit(
+                run_command,
+                [sys.executable, "-m", "pytest", *UNIT_TEST_NODES, *plugin_args(args.isolate),
+                 "-v", "--tb=short", "-x", f"--junitxml={junit_path}"],
+                "Run unit tests"
+            )
+            # The import check doesn't need pytest; it goes through the module launcher
+            import_check = executor.submit(
+                run_command,
+                [sys.executable, "-m", "smartsheet_ops", "--version"],
+                "Test basic import"
+            )
+            session_ok = session.result()
+            import_ok = import_check.result()
+        case_results = junit_results(junit_path)
+    
     results = []
-    for config in test_configs:
-        success = run_command(config["cmd"], config["description"])
-        results.append((config["description"], success))
+    for prefix, description in summary_groups:
+        results.append((description, group_passed(case_results, prefix, session_ok)))
+    results.append(("Test basic import", import_ok))
     
     # Summary
     print("\n" + "=" * 50)
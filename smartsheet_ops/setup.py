@@ -1,34 +1,46 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_namespace_packages
 
 setup(
     name="smartsheet_ops",
-    version="0.1.0",
+    version="0.2.0",
     description="Healthcare analytics operations for Smartsheet",
     author="Timothy Driscoll",
     author_email="timothy.driscoll@example.com",
     url="https://github.com/terilios/smartsheet-server",
-    packages=find_packages(),
+    packages=find_namespace_packages(include=["smartsheet_ops", "smartsheet_ops.*"]),
+    include_package_data=True,
     install_requires=[
-        'smartsheet-python-sdk>=2.0.0',
-        'aiohttp>=3.8.0',
-        'tiktoken>=0.5.0',
-        'python-dotenv>=1.0.0',
-        'openai>=1.0.0'
+        'smartsheet-python-sdk>=2.0.0,<5',
+        'aiohttp>=3.8.0,<4',
+        'tiktoken>=0.5.0,<1',
+        'python-dotenv>=1.0.0,<2',
+        'openai>=1.0.0,<2'
     ],
+    extras_require={
+        'search': [
+            'hyperscan>=0.4.0',
+            'google-re2>=1.1',
+        ],
+        'json': [
+            'orjson>=3.9',
+        ],
+        'test': [
+            'pytest>=7.0',
+            'pytest-xdist>=3.3.0',
+            'pytest-forked>=1.6.0',
+        ],
+    },
     entry_points={
         'console_scripts': [
-            'smartsheet-ops=smartsheet_ops.cli:main',
+            'smartsheet-ops=smartsheet_ops.cli:run',
         ],
     },
-    python_requires='>=3.8',
+    python_requires='>=3.11',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Healthcare Industry',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.8',
-        'Programming Language :: Python :: 3.9',
-        'Programming Language :: Python :: 3.10',
         'Programming Language :: Python :: 3.11',
         'Programming Language :: Python :: 3.12',
         'Topic :: Scientific/Engineering :: Medical Science Apps.',
@@ -1,38 +1,67 @@
 import smartsheet
+import bisect
+import importlib
 import json
+import operator
 import re
+import sys
+import time
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Union
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Any, Set, Tuple, Union, cast
+
+
+def _optional_import(name: str) -> Optional[ModuleType]:
+    """Import an optional dependency, or return None if it isn't installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Optional: prefilters regex searches in search_sheet
+hyperscan = _optional_import('hyperscan')
+# Optional: linear-time matching for regex searches in search_sheet
+re2 = _optional_import('re2')
+# Optional: faster JSON parsing
+orjson = _optional_import('orjson')
+
+__version__ = "0.2.0"
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # System column types in their exact API form
-SYSTEM_COLUMN_TYPES = {
+SYSTEM_COLUMN_TYPES = frozenset({
     'AUTO_NUMBER',   # For auto-numbered columns
     'CREATED_DATE',  # For creation timestamp
     'MODIFIED_DATE', # For last modified timestamp
     'CREATED_BY',    # For creator info
     'MODIFIED_BY',   # For last modifier info
     'FORMULA'        # For formula columns
-}
+})
 
 # Project plan specific column types
-PROJECT_COLUMN_TYPES = {
+PROJECT_COLUMN_TYPES = frozenset({
     'DURATION',           # Task duration
     'ABSTRACT_DATETIME',  # Start/Finish dates in project plans
     'PREDECESSOR',        # Task dependencies
     'CONTACT_LIST',       # Resource assignments
     'PICKLIST',          # Status dropdowns
     'DATETIME'           # Standard date/time columns
-}
+})
 
 # Multi-value column types
-MULTI_VALUE_COLUMN_TYPES = {
+MULTI_VALUE_COLUMN_TYPES = frozenset({
     'MULTI_CONTACT_LIST', # Multiple contact assignments
     'MULTI_PICKLIST'      # Multiple selections from picklist
-}
+})
 
 # All recognized column types (for validation)
 ALL_COLUMN_TYPES = SYSTEM_COLUMN_TYPES | PROJECT_COLUMN_TYPES | MULTI_VALUE_COLUMN_TYPES | {
@@ -41,39 +70,266 @@ ALL_COLUMN_TYPES = SYSTEM_COLUMN_TYPES | PROJECT_COLUMN_TYPES | MULTI_VALUE_COLU
     'CHECKBOX'          # Checkbox columns
 }
 
+# objectType of the object_value written for multi-select cells
+MULTI_PICKLIST_OBJECT_TYPE = 'MULTI_PICKLIST'
+
+# Column attributes recorded in get_column_info's "debug" dict
+COLUMN_DEBUG_ATTRS = (
+    '_type_', '_system_column_type', 'system_column_type',
+    'auto_number_format', '_auto_number_format',
+    '_validation', 'validation',
+    '_format_', 'format',
+    'formula', '_formula'
+)
+
+# Where get_column_info looks for a column's system type, formula and
+# auto-number format, in order of preference
+SYSTEM_TYPE_ATTRS = ('_system_column_type', 'system_column_type')
+FORMULA_ATTRS = ('formula', '_formula')
+AUTO_NUMBER_FORMAT_ATTRS = ('auto_number_format', '_auto_number_format')
+
+# One pattern match within a cell, as yielded by iter_search_matches(compact=True);
+# span is the (start, end) offsets of matched_text in str(value)
+SearchMatch = namedtuple('SearchMatch', 'column value matched_text before after span')
+
+
+def search_match_to_dict(match: SearchMatch) -> Dict[str, Any]:
+    """Convert a SearchMatch into the dict form used in search_sheet results."""
+    return {
+        'column': match.column,
+        'value': match.value,
+        'matched_text': match.matched_text,
+        'span': match.span,
+        'context': {
+            'before': match.before,
+            'after': match.after
+        }
+    }
+
+
+# bulk_update condition operators: (cell value, expected value) -> bool
+CONDITION_OPERATORS: Dict[Any, Callable[[Any, Any], Any]] = {
+    'equals': operator.eq,
+    'contains': lambda cell_value, expected_value: expected_value in str(cell_value),
+    'greaterThan': operator.gt,
+    'lessThan': operator.lt
+}
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date/time as sent by Smartsheet, accepting a trailing Z."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-like value, sharing the leaves."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _is_none_string(value: str) -> bool:
+    """Check whether an SDK attribute string is 'None' in any casing."""
+    return value.casefold() == 'none'
+
+
+# Column references in a formula, e.g. [Task Name]@row
+FORMULA_DEPENDENCY_RE = re.compile(r'\[([^\]]+)\]')
+
+
+@lru_cache(maxsize=4096)
+def formula_dependencies(formula: str) -> Tuple[str, ...]:
+    """Column titles referenced by a formula, in order of first use."""
+    return tuple(dict.fromkeys(FORMULA_DEPENDENCY_RE.findall(formula)))
+
+
+@lru_cache(maxsize=256)
+def compile_search_pattern(
+    raw: str,
+    flags: int,
+    whole_word: bool,
+    use_regex: bool,
+    use_re2: bool = False
+) -> "re.Pattern":
+    r"""
+    Build and compile a search_sheet pattern, reusing it across repeated searches.
+
+    With use_re2 the pattern is compiled with RE2, which matches in linear
+    time, falling back to re for features RE2 lacks (backreferences,
+    lookaround). RE2's \b, \w and \d are ASCII-only.
+    """
+    pattern = raw if use_regex else re.escape(raw)
+    if whole_word:
+        pattern = fr'\b{pattern}\b'
+    if use_re2 and re2 is not None:
+        # RE2 takes Options rather than re's flag bits
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error as e:
+            logger.debug(f"RE2 rejected pattern, using re: {e}")
+    return re.compile(pattern, flags)
+
+
+# Pattern syntax Hyperscan reads differently from re: whole-buffer anchors
+# (which would only match at the ends of the joined values) and {,n}
+HYPERSCAN_UNSAFE_SYNTAX_RE = re.compile(r'\\[AZz]|\{,')
+
+# Characters of context search_sheet keeps on each side of a match
+SEARCH_CONTEXT_CHARS = 40
+
+# Joins cell values for single-pass literal searches in search_sheet
+SEARCH_SEPARATOR = '\x1e'
+
+# Rows fetched per request when search_sheet pages through a sheet
+SEARCH_PAGE_SIZE = 500
+
+# Rows returned as sample_data by get_sheet_info
+SAMPLE_ROW_COUNT = 5
+
+# get_sheet_info cache defaults: seconds an entry stays fresh, and how many
+# sheets are kept per SmartsheetOperations instance
+SHEET_INFO_CACHE_TTL = 60.0
+SHEET_INFO_CACHE_SIZE = 128
+
+# Workspaces.get_workspace cache defaults, as for get_sheet_info
+WORKSPACE_CACHE_TTL = 30.0
+WORKSPACE_CACHE_SIZE = 128
+
+# Row positioning keys accepted by add_rows: camelCase API name -> SDK attribute
+HIERARCHY_ATTRIBUTES = {
+    'parentId': 'parent_id',
+    'toTop': 'to_top',
+    'toBottom': 'to_bottom',
+    'above': 'above',
+    'below': 'below',
+    'siblingId': 'sibling_id'
+}
+
+# Maximum rows per Sheets.update_rows request
+UPDATE_ROWS_BATCH_SIZE = 500
+
+# Default number of update requests sent in parallel
+UPDATE_CONCURRENCY = 4
+
+# _validate_row_ids checks fewer row IDs than this with one get_row request
+# each, instead of paging through the whole sheet
+ROW_LOOKUP_THRESHOLD = 50
+
+# Row IDs _validate_row_ids sends per filtered get_sheet request, keeping
+# the query string well under URL length limits
+ROW_ID_FILTER_SIZE = 100
+
+# Reads a row's ID without a Python-level call per row
+ROW_ID = operator.attrgetter('id_')
+
+# Smartsheet API error code for a resource that does not exist
+API_ERROR_NOT_FOUND = 1006
+
 class SmartsheetOperations:
-    def __init__(self, api_key: str):
-        """Initialize SmartsheetOperations with proper error handling."""
+    def __init__(
+        self,
+        api_key: str,
+        sheet_info_ttl: float = SHEET_INFO_CACHE_TTL,
+        sheet_info_cache_size: int = SHEET_INFO_CACHE_SIZE,
+        workspace_ttl: float = WORKSPACE_CACHE_TTL,
+        workspace_cache_size: int = WORKSPACE_CACHE_SIZE,
+        client: Optional[Any] = None
+    ):
+        """
+        Initialize SmartsheetOperations with proper error handling.
+
+        Pass client to share an already configured SDK client (with
+        errors_as_exceptions on) instead of building one from api_key.
+        """
         if not api_key:
             raise ValueError("API key is required and cannot be empty")
         
         if not isinstance(api_key, str):
             raise ValueError("API key must be a string")
         
-        try:
-            logger.info("Initializing Smartsheet client")
-            self.client = smartsheet.Smartsheet(api_key)
-            self.client.errors_as_exceptions(True)
-            logger.info("Smartsheet client initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Smartsheet client: {e}", exc_info=True)
-            raise RuntimeError(f"Failed to initialize Smartsheet client: {str(e)}")
+        if client is not None:
+            self.client = client
+        else:
+            try:
+                logger.info("Initializing Smartsheet client")
+                self.client = smartsheet.Smartsheet(api_key)
+                self.client.errors_as_exceptions(True)
+                logger.info("Smartsheet client initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize Smartsheet client: {e}", exc_info=True)
+                raise RuntimeError(f"Failed to initialize Smartsheet client: {str(e)}")
 
-    def _normalize_column_type(self, value: Optional[str]) -> Optional[str]:
-        """Normalize column type for system type detection."""
-        if not value or value.lower() == 'none':
-            return None
-        return value.strip()  # API values are already in correct case
+        # sheet_id -> (fetched_at, get_sheet_info result), least recently used first
+        self.sheet_info_ttl = sheet_info_ttl
+        self.sheet_info_cache_size = sheet_info_cache_size
+        self._sheet_info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Same, without sample rows, for row operations; row changes keep it
+        self._sheet_schema_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        # workspace_id -> (fetched_at, Workspace), least recently used first
+        self.workspace_ttl = workspace_ttl
+        self.workspace_cache_size = workspace_cache_size
+        self._workspace_cache: "OrderedDict[int, Tuple[float, Any]]" = OrderedDict()
+
+    def invalidate_sheet_info(self, sheet_id: Optional[str] = None, schema: bool = True) -> None:
+        """
+        Drop cached get_sheet_info results for one sheet, or all sheets if sheet_id is None.
+
+        Pass schema=False after changes to rows only, to keep the cached
+        column details used by row operations.
+        """
+        caches = [self._sheet_info_cache]
+        if schema:
+            caches.append(self._sheet_schema_cache)
+        for cache in caches:
+            if sheet_id is None:
+                cache.clear()
+            else:
+                cache.pop(str(sheet_id), None)
+
+    def invalidate_workspace(self, workspace_id: Optional[Union[str, int]] = None) -> None:
+        """Drop cached workspaces for one workspace, or all if workspace_id is None."""
+        if workspace_id is None:
+            self._workspace_cache.clear()
+        else:
+            self._workspace_cache.pop(int(workspace_id), None)
+
+    def _get_workspace_cached(self, workspace_id: int) -> Any:
+        """Return Workspaces.get_workspace(workspace_id), reusing a fresh cached response."""
+        cached = self._workspace_cache.get(workspace_id)
+        if cached is not None:
+            fetched_at, workspace = cached
+            if time.monotonic() - fetched_at < self.workspace_ttl:
+                self._workspace_cache.move_to_end(workspace_id)
+                return workspace
+            del self._workspace_cache[workspace_id]
+        
+        workspace = self.client.Workspaces.get_workspace(workspace_id)
+        if self.workspace_ttl > 0:
+            self._workspace_cache[workspace_id] = (time.monotonic(), workspace)
+            while len(self._workspace_cache) > self.workspace_cache_size:
+                self._workspace_cache.popitem(last=False)
+        return workspace
 
     def _process_auto_number_config(self, column: Any, info: Dict[str, Any]) -> None:
         """Process auto-number configuration if present."""
-        format_attrs = ['auto_number_format', '_auto_number_format']
-        for attr in format_attrs:
+        for attr in AUTO_NUMBER_FORMAT_ATTRS:
             if hasattr(column, attr):
                 try:
                     auto_number_format = str(getattr(column, attr))
-                    if auto_number_format and auto_number_format.lower() != 'none':
-                        config = json.loads(auto_number_format)
+                    if auto_number_format and not _is_none_string(auto_number_format):
+                        # orjson's decode error subclasses json.JSONDecodeError
+                        config = (orjson.loads if orjson is not None else json.loads)(auto_number_format)
                         info["auto_number"] = {
                             "prefix": config.get("prefix", ""),
                             "fill": config.get("fill", ""),
@@ -84,13 +340,16 @@ class SmartsheetOperations:
                 break
 
     def _process_picklist_options(self, column: Any, info: Dict[str, Any]) -> None:
-        """Process picklist options if present."""
+        """Process picklist options if present, as a tuple since cached info is shared."""
+        options: Any = getattr(column, '_options', _MISSING)
+        if options is _MISSING:
+            options = getattr(column, 'options', _MISSING)
+        if options is _MISSING:
+            return
         try:
-            if hasattr(column, '_options'):
-                info["options"] = [str(opt) for opt in column._options]
-            elif hasattr(column, 'options'):
-                info["options"] = [str(opt) for opt in column.options]
-        except:
+            info["options"] = tuple(map(str, options))
+        except (AttributeError, TypeError):
+            # Unset or non-iterable options
             pass
 
     def _add_metadata(self, column: Any, info: Dict[str, Any]) -> None:
@@ -106,18 +365,35 @@ class SmartsheetOperations:
             info["format"] = str(column.format)
 
     def _parse_formula_dependencies(self, formula: str) -> List[str]:
-        """Extract column references from a formula string."""
-        import re
-        return list(set(re.findall(r'\[([^\]]+)\]', formula)))
+        """Extract column references from a formula string, in order of first use."""
+        return list(formula_dependencies(formula))
 
-    def get_column_info(self, column: Any) -> Dict[str, Any]:
+    def _has_system_type(self, debug: Dict[str, str]) -> bool:
+        """Check if get_column_info's debug strings name a known system column type."""
+        return any(
+            debug[attr].strip() in SYSTEM_COLUMN_TYPES
+            for attr in SYSTEM_TYPE_ATTRS
+            if attr in debug
+        )
+
+    def _has_formula(self, debug: Dict[str, str]) -> bool:
+        """Check if get_column_info's debug strings hold a column formula."""
+        return any(
+            debug[attr] and not _is_none_string(debug[attr])
+            for attr in FORMULA_ATTRS
+            if attr in debug
+        )
+
+    def get_column_info(self, column: Any, column_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract column information safely.
         Distinguish base column types from system-managed or formula-based columns.
         Enhanced to properly detect project plan column types.
+
+        column_id is the column's already-stringified id, if the caller has it.
         """
-        info = {
-            "id": str(column.id_),
+        info: Dict[str, Any] = {
+            "id": column_id if column_id is not None else str(column.id_),
             "type": "TEXT_NUMBER",  # Default final/effective type
             "system_managed": False,
             "project_column": False,  # New flag for project-specific columns
@@ -125,26 +401,39 @@ class SmartsheetOperations:
         }
         
         try:
-            # Collect raw debug info
-            debug_attrs = [
-                '_type_', '_system_column_type', 'system_column_type',
-                'auto_number_format', '_auto_number_format',
-                '_validation', 'validation',
-                '_format_', 'format',
-                'formula', '_formula'
-            ]
-            for attr in debug_attrs:
-                if hasattr(column, attr):
-                    info["debug"][attr] = str(getattr(column, attr))
+            # Collect raw debug info. The steps below read these strings back
+            # instead of probing the column again. Instance attributes come
+            # from one vars() snapshot; getattr is only needed for properties
+            # defined on the SDK class.
+            debug = info["debug"]
+            instance_attrs = getattr(column, '__dict__', None) or {}
+            for attr in COLUMN_DEBUG_ATTRS:
+                value = instance_attrs.get(attr, _MISSING)
+                if value is _MISSING:
+                    value = getattr(column, attr, _MISSING)
+                if value is not _MISSING:
+                    debug[attr] = str(value)
+
+            # Fast path for the most common column: plain TEXT_NUMBER with no
+            # system type or formula only needs its metadata (step 5)
+            if (
+                debug.get('_type_', '').strip() == 'TEXT_NUMBER'
+                and not self._has_system_type(debug)
+                and not self._has_formula(debug)
+            ):
+                self._add_metadata(column, info)
+                return info
 
             # 1) Detect system column type first (highest priority)
             system_type = None
             system_managed = False
-            for attr in ['_system_column_type', 'system_column_type']:
-                if hasattr(column, attr):
-                    raw_value = str(getattr(column, attr))
-                    normalized = self._normalize_column_type(raw_value)
-                    if normalized and normalized in SYSTEM_COLUMN_TYPES:
+            for attr in SYSTEM_TYPE_ATTRS:
+                if attr in debug:
+                    raw_value = debug[attr]
+                    # API values are already in correct case; empty and
+                    # 'None' strings are never members, so no lower() needed
+                    normalized = raw_value.strip()
+                    if normalized in SYSTEM_COLUMN_TYPES:
                         info["system_column_type"] = raw_value
                         info["type"] = normalized  # Use normalized value for type
                         system_type = normalized
@@ -152,7 +441,7 @@ class SmartsheetOperations:
 
                         if normalized == 'AUTO_NUMBER':
                             self._process_auto_number_config(column, info)
-                        elif normalized in ['CREATED_DATE', 'MODIFIED_DATE']:
+                        elif normalized in ('CREATED_DATE', 'MODIFIED_DATE'):
                             info["format_type"] = "system_datetime"
                         # Stop if system type is found
                         break
@@ -160,7 +449,7 @@ class SmartsheetOperations:
             # 2) If not a system column, get column type from debug info
             if not system_managed and '_type_' in info["debug"]:
                 raw_type = info["debug"]['_type_']
-                if raw_type and raw_type.lower() != 'none':
+                if raw_type and not _is_none_string(raw_type):
                     detected_type = raw_type.strip()
                     
                     # Check if it's a project plan specific type
@@ -175,7 +464,7 @@ class SmartsheetOperations:
                             info["supports_multiple"] = True
                         elif detected_type == "DURATION":
                             info["format_type"] = "duration"
-                        elif detected_type in ["ABSTRACT_DATETIME", "DATETIME"]:
+                        elif detected_type in ("ABSTRACT_DATETIME", "DATETIME"):
                             info["format_type"] = "datetime"
                         elif detected_type == "PREDECESSOR":
                             info["format_type"] = "predecessor"
@@ -198,10 +487,10 @@ class SmartsheetOperations:
 
             # 3) If no system column type found, check for a formula
             if not system_type and not info["project_column"]:
-                for attr in ['formula', '_formula']:
-                    if hasattr(column, attr):
-                        formula_val = str(getattr(column, attr))
-                        if formula_val and formula_val.lower() != 'none':
+                for attr in FORMULA_ATTRS:
+                    if attr in debug:
+                        formula_val = debug[attr]
+                        if formula_val and not _is_none_string(formula_val):
                             info["formula"] = formula_val
                             info["dependencies"] = self._parse_formula_dependencies(formula_val)
                             info["type"] = "FORMULA"  # effective type is formula
@@ -217,7 +506,8 @@ class SmartsheetOperations:
                 info["type"] = info["type"].split('.')[-1]
             
             # 4) Handle picklist options if it's a picklist (for both project and standard)
-            if info["type"] == "PICKLIST":
+            # and step 2 didn't already
+            if info["type"] == "PICKLIST" and "options" not in info:
                 self._process_picklist_options(column, info)
 
             # 5) Add validation and format metadata
@@ -244,7 +534,17 @@ class SmartsheetOperations:
         return info
 
     def get_sheet_info(self, sheet_id: str) -> Dict[str, Any]:
-        """Get sheet information including columns and sample data."""
+        """
+        Get sheet information including columns and sample data.
+
+        Successful results are cached per sheet for sheet_info_ttl seconds;
+        mutating operations on this instance invalidate the entry. Each call
+        returns its own copy, so callers may modify it freely.
+        """
+        return _copy_json(self._sheet_info(sheet_id))
+
+    def _sheet_info(self, sheet_id: str) -> Dict[str, Any]:
+        """get_sheet_info without the copy, for internal read-only use."""
         logger.info(f"Getting sheet info for sheet ID: {sheet_id}")
         
         # Input validation
@@ -253,135 +553,266 @@ class SmartsheetOperations:
             logger.error(error_msg)
             return {"error": error_msg}
         
+        cached = self._get_cached_sheet_info(sheet_id)
+        if cached is not None:
+            logger.debug(f"Using cached sheet info for {sheet_id}")
+            return cached
+        
+        result = self._fetch_sheet_info(sheet_id)
+        self._cache_sheet_info(sheet_id, result)
+        return result
+
+    def _get_cached_sheet_info(self, sheet_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached get_sheet_info result if it is still fresh."""
+        cached = self._sheet_info_cache.get(sheet_id)
+        if cached is None:
+            return None
+        fetched_at, result = cached
+        if time.monotonic() - fetched_at >= self.sheet_info_ttl:
+            del self._sheet_info_cache[sheet_id]
+            return None
+        self._sheet_info_cache.move_to_end(sheet_id)
+        return result
+
+    def _cache_sheet_info(self, sheet_id: str, result: Dict[str, Any]) -> None:
+        """Store a successful get_sheet_info result, evicting the oldest entries."""
+        if "error" in result or self.sheet_info_ttl <= 0:
+            return
+        self._sheet_info_cache[sheet_id] = (time.monotonic(), result)
+        while len(self._sheet_info_cache) > self.sheet_info_cache_size:
+            self._sheet_info_cache.popitem(last=False)
+
+    def _get_sheet_schema(self, sheet_id: str) -> Dict[str, Any]:
+        """
+        Get sheet info without sample rows, for row operations.
+
+        Cached like get_sheet_info, but only dropped when columns may have
+        changed, so back-to-back row mutations share one fetch.
+        """
+        cached = self._sheet_schema_cache.get(sheet_id)
+        if cached is not None:
+            fetched_at, schema = cached
+            if time.monotonic() - fetched_at < self.sheet_info_ttl:
+                self._sheet_schema_cache.move_to_end(sheet_id)
+                return schema
+            del self._sheet_schema_cache[sheet_id]
+        
+        # Reuse a fresh get_sheet_info result if there is one; otherwise
+        # fetch just the columns, skipping the sample rows
+        sheet_info = self._get_cached_sheet_info(sheet_id)
+        if sheet_info is None:
+            sheet_info = self._fetch_sheet_schema(sheet_id)
+        if "error" in sheet_info:
+            return sheet_info
+        schema = {
+            key: value for key, value in sheet_info.items()
+            if key not in ('sample_data', 'usage_example')
+        }
+        # Build the validation lookups once per cached schema rather than
+        # once per row operation
+        column_info = schema.get('column_info', {})
+        schema['picklist_options'] = self._picklist_options(column_info)
+        schema['system_managed_fields'] = self._system_managed_fields(column_info)
+        schema['formula_references'] = self._formula_references(column_info)
+        if self.sheet_info_ttl > 0:
+            self._sheet_schema_cache[sheet_id] = (time.monotonic(), schema)
+            while len(self._sheet_schema_cache) > self.sheet_info_cache_size:
+                self._sheet_schema_cache.popitem(last=False)
+        return schema
+
+    def _fetch_sheet_schema(self, sheet_id: str) -> Dict[str, Any]:
+        """Fetch only a sheet's columns and build the column part of get_sheet_info (uncached)."""
+        if not sheet_id or not isinstance(sheet_id, str):
+            error_msg = f"Invalid sheet_id provided: {sheet_id}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+        
         try:
-            # Get the sheet with level parameter for complex column types
+            columns = self.client.Sheets.get_columns(sheet_id, include_all=True, level=2).data
+            column_map, column_info, _ = self._build_column_maps(columns or [])
+        except Exception as e:
+            error_msg = f"Failed to get sheet info for {sheet_id}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return {"error": error_msg}
+        
+        return {
+            "success": True,
+            "sheet_id": sheet_id,
+            "column_map": column_map,
+            "column_info": column_info,
+            "formula_columns": self._formula_columns(column_info)
+        }
+
+    def _fetch_sheet_info(self, sheet_id: str) -> Dict[str, Any]:
+        """Fetch the sheet and build the get_sheet_info result (uncached)."""
+        try:
+            # Get the sheet with level parameter for complex column types;
+            # only the first page of rows is needed for sample data
             logger.debug(f"Fetching sheet data from Smartsheet API")
             sheet = self.client.Sheets.get_sheet(
                 sheet_id,
                 level=2,
-                include='objectValue'
+                include='objectValue',
+                page_size=SAMPLE_ROW_COUNT,
+                page=1
             )
+            return self._build_sheet_info(sheet_id, sheet)
             
-            # Validate sheet response
-            if not sheet:
-                error_msg = f"Sheet not found or access denied for sheet ID: {sheet_id}"
-                logger.error(error_msg)
-                return {"error": error_msg}
-            
-            # Get columns with proper error handling
-            columns = getattr(sheet, 'columns', None)
-            if not columns:
-                logger.warning(f"No columns found for sheet {sheet_id}")
-                return {
-                    "success": True,
-                    "sheet_id": sheet_id,
-                    "column_map": {},
-                    "column_info": {},
-                    "sample_data": [],
-                    "usage_example": {"column_map": {}, "row_data": []}
-                }
-            
-            column_map = {}
-            column_info = {}
-            
-            # First pass: Map column titles to IDs
-            try:
-                for col in columns:
-                    try:
-                        col_title = getattr(col, 'title', None)
-                        col_id = getattr(col, 'id_', getattr(col, 'id', None))
-                        
-                        if col_title and col_id:
-                            column_map[col_title] = str(col_id)
-                        else:
-                            logger.warning(f"Skipping column with missing title or id: title={col_title}, id={col_id}")
-                    except Exception as col_error:
-                        logger.warning(f"Error processing column: {col_error}")
-                        continue
-            except Exception as e:
-                logger.error(f"Error iterating over columns: {e}")
-                return {"error": f"Failed to process sheet columns: {str(e)}"}
-            
-            # Second pass: Gather detailed info for each column
-            for col in columns:
-                try:
-                    col_title = getattr(col, 'title', None)
-                    if col_title and col_title in column_map:
-                        try:
-                            column_info[col_title] = self.get_column_info(col)
-                        except Exception as info_error:
-                            logger.warning(f"Error getting column info for {col_title}: {info_error}")
-                            # Fallback to minimal info
-                            column_info[col_title] = {
-                                "id": column_map[col_title],
-                                "type": "TEXT_NUMBER"
-                            }
-                except Exception as col_error:
-                    logger.warning(f"Error processing column details: {col_error}")
-                    continue
-            
-            # Gather up to 5 rows of sample data
-            sample_data = []
-            try:
-                rows = getattr(sheet, 'rows', [])
-                for i, row in enumerate(rows):
-                    if i >= 5:
-                        break
-                    
-                    try:
-                        row_id = getattr(row, 'id', None)
-                        row_data = {"__id": str(row_id) if row_id else f"row_{i}"}
-                        
-                        cells = getattr(row, 'cells', [])
-                        for cell in cells:
-                            try:
-                                cell_column_id = getattr(cell, 'column_id', None)
-                                cell_value = getattr(cell, 'value', None)
-                                
-                                # Find the column title for this cell
-                                for col in columns:
-                                    col_id = getattr(col, 'id_', getattr(col, 'id', None))
-                                    col_title = getattr(col, 'title', None)
-                                    
-                                    if col_id and str(col_id) == str(cell_column_id):
-                                        row_data[col_title] = cell_value
-                                        break
-                            except Exception as cell_error:
-                                logger.warning(f"Error processing cell: {cell_error}")
-                                continue
-                        
-                        sample_data.append(row_data)
-                    except Exception as row_error:
-                        logger.warning(f"Error processing row {i}: {row_error}")
-                        continue
-            except Exception as rows_error:
-                logger.warning(f"Error processing rows: {rows_error}")
-            
-            # Create an example row using the column_map
-            example_row = {}
-            for title in column_map.keys():
-                example_row[title] = "sample_value"
-            
-            # Prepare successful response
-            result = {
+        except Exception as e:
+            error_msg = f"Failed to get sheet info for {sheet_id}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return {"error": error_msg}
+
+    def _build_sheet_info(self, sheet_id: str, sheet: Any) -> Dict[str, Any]:
+        """Build the get_sheet_info result from an already-fetched sheet."""
+        # Validate sheet response
+        if not sheet:
+            error_msg = f"Sheet not found or access denied for sheet ID: {sheet_id}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+        
+        # Get columns with proper error handling
+        columns = getattr(sheet, 'columns', None)
+        if not columns:
+            logger.warning(f"No columns found for sheet {sheet_id}")
+            return {
                 "success": True,
                 "sheet_id": sheet_id,
+                "column_map": {},
+                "column_info": {},
+                "formula_columns": [],
+                "sample_data": [],
+                "usage_example": {"column_map": {}, "row_data": []}
+            }
+        
+        try:
+            column_map, column_info, id_to_title = self._build_column_maps(columns)
+        except Exception as e:
+            logger.error(f"Error iterating over columns: {e}")
+            return {"error": f"Failed to process sheet columns: {str(e)}"}
+        
+        sample_data = self._get_sample_data(sheet, id_to_title)
+        
+        # Create an example row using the column_map
+        example_row = dict.fromkeys(column_map, "sample_value")
+        
+        # Prepare successful response
+        result = {
+            "success": True,
+            "sheet_id": sheet_id,
+            "column_map": column_map,
+            "column_info": column_info,
+            # Titles of columns with a column formula, for reference updates
+            "formula_columns": self._formula_columns(column_info),
+            "sample_data": sample_data,
+            "usage_example": {
                 "column_map": column_map,
-                "column_info": column_info,
-                "sample_data": sample_data,
-                "usage_example": {
-                    "column_map": column_map,
-                    "row_data": [example_row]
-                }
+                "row_data": [example_row]
             }
+        }
+        
+        logger.info(f"Successfully retrieved sheet info for {sheet_id}: {len(column_map)} columns, {len(sample_data)} sample rows")
+        return result
+
+    def _column_id(self, column: Any) -> Any:
+        """Get a column's id_, only falling back to id (an SDK __getattr__ alias) if missing."""
+        column_id = getattr(column, 'id_', _MISSING)
+        if column_id is _MISSING:
+            column_id = getattr(column, 'id', None)
+        return column_id
+
+    def _formula_columns(self, column_info: Dict[str, Any]) -> List[str]:
+        """Titles of columns with a column formula."""
+        return [
+            title for title, info in column_info.items()
+            if info.get('type') == 'FORMULA' and info.get('formula')
+        ]
+
+    def _build_column_maps(self, columns: Any) -> Tuple[Dict[str, str], Dict[str, Any], Dict[str, Any]]:
+        """
+        Build column lookups from a fetched sheet's columns.
+
+        Returns:
+            Tuple of (column_map: title -> id, column_info: title -> details,
+            id_to_title: str(column id) -> title)
+
+        Raises:
+            Exception: If the sheet's columns cannot be iterated
+        """
+        column_map = {}
+        column_info = {}
+        id_to_title: Dict[str, Any] = {}  # str(column id) -> title, for cell lookups
+        
+        # Single pass: map titles to IDs and gather detailed info per column
+        get_column_info = self.get_column_info
+        for col in columns:
+            try:
+                col_title = getattr(col, 'title', None)
+                col_id = self._column_id(col)
+                
+                # Intern titles and ids: every sheet fetch and cached entry
+                # then shares one copy, and lookups keyed by them compare by
+                # identity
+                if isinstance(col_title, str):
+                    col_title = sys.intern(col_title)
+                col_id_str = sys.intern(str(col_id))
+                if col_id:
+                    id_to_title.setdefault(col_id_str, col_title)
+                if not (col_title and col_id):
+                    logger.warning(f"Skipping column with missing title or id: title={col_title}, id={col_id}")
+                    continue
+                column_map[col_title] = col_id_str
+            except Exception as col_error:
+                logger.warning(f"Error processing column: {col_error}")
+                continue
             
-            logger.info(f"Successfully retrieved sheet info for {sheet_id}: {len(column_map)} columns, {len(sample_data)} sample rows")
-            return result
-            
-        except Exception as e:
-            error_msg = f"Failed to get sheet info for {sheet_id}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return {"error": error_msg}
+            try:
+                column_info[col_title] = get_column_info(col, col_id_str)
+            except Exception as info_error:
+                logger.warning(f"Error getting column info for {col_title}: {info_error}")
+                # Fallback to minimal info
+                column_info[col_title] = {
+                    "id": col_id_str,
+                    "type": "TEXT_NUMBER"
+                }
+        
+        return column_map, column_info, id_to_title
+
+    def _get_sample_data(self, sheet: Any, id_to_title: Dict[str, Any], limit: int = SAMPLE_ROW_COUNT) -> List[Dict[str, Any]]:
+        """Gather up to `limit` rows of sample data from a fetched sheet."""
+        sample_data = []
+        try:
+            rows = getattr(sheet, 'rows', [])
+            for i, row in enumerate(rows):
+                if i >= limit:
+                    break
+                
+                try:
+                    row_id = getattr(row, 'id', None)
+                    row_data: Dict[str, Any] = {"__id": str(row_id) if row_id else f"row_{i}"}
+                    
+                    cells = getattr(row, 'cells', [])
+                    for cell in cells:
+                        try:
+                            cell_column_id = getattr(cell, 'column_id', None)
+                            cell_value = getattr(cell, 'value', None)
+                            
+                            # Find the column title for this cell
+                            title = id_to_title.get(str(cell_column_id), _MISSING)
+                            if title is not _MISSING:
+                                row_data[title] = cell_value
+                        except Exception as cell_error:
+                            logger.warning(f"Error processing cell: {cell_error}")
+                            continue
+                    
+                    sample_data.append(row_data)
+                except Exception as row_error:
+                    logger.warning(f"Error processing row {i}: {row_error}")
+                    continue
+        except Exception as rows_error:
+            logger.warning(f"Error processing rows: {rows_error}")
+        
+        return sample_data
 
     def _create_cell(self, column_id: int, value: Any, column_info: Dict) -> smartsheet.models.Cell:
         """Create a cell with proper handling of multi-select picklist values."""
@@ -391,7 +822,7 @@ class SmartsheetOperations:
         if isinstance(value, list) and value:
             # For multi-select values, only use object_value
             cell.object_value = {
-                'objectType': 'MULTI_PICKLIST',
+                'objectType': MULTI_PICKLIST_OBJECT_TYPE,
                 'values': value
             }
         else:
@@ -400,83 +831,177 @@ class SmartsheetOperations:
         
         return cell
 
-    def add_rows(self, sheet_id: str, row_data: List[Dict[str, Any]], column_map: Dict[str, str]) -> Dict[str, Any]:
-        """Add rows to a sheet with optional hierarchy support. Skips system-managed columns."""
+    def load_schema(self, sheet_id: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Get a sheet's column map and column info for reuse across mutations.
+
+        Pass the column info back to add_rows/update_rows to skip their own
+        sheet-info lookup.
+
+        Returns:
+            Tuple of (column_map: title -> id, column_info: title -> details)
+
+        Raises:
+            RuntimeError: If the sheet info cannot be retrieved
+        """
+        sheet_info = self.get_sheet_info(sheet_id)
+        if 'error' in sheet_info:
+            raise RuntimeError(f"Failed to load schema: {sheet_info['error']}")
+        return sheet_info.get('column_map', {}), sheet_info.get('column_info', {})
+
+    @contextmanager
+    def sheet_context(
+        self,
+        sheet_id: str,
+        column_info: Optional[Dict[str, Any]] = None
+    ) -> Iterator["SheetContext"]:
+        """
+        Share one sheet-info lookup across several operations on a sheet.
+
+        If column_info (e.g. from load_schema) is given, no lookup is made.
+
+        Example:
+            with ops.sheet_context(sheet_id) as ctx:
+                ctx.add_rows(row_data)
+                ctx.update_rows(updates)
+        """
+        if column_info is not None:
+            sheet_info = {
+                'column_map': {title: info['id'] for title, info in column_info.items()},
+                'column_info': column_info
+            }
+        else:
+            sheet_info = self._get_sheet_schema(sheet_id)
+        yield SheetContext(self, sheet_id, sheet_info)
+
+    def add_rows(
+        self,
+        sheet_id: str,
+        row_data: List[Dict[str, Any]],
+        column_map: Dict[str, str],
+        column_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Add rows to a sheet with optional hierarchy support. Skips system-managed columns.
+
+        column_info (e.g. from load_schema) avoids fetching the sheet info.
+        """
         try:
             # Retrieve sheet info to identify system-managed columns
-            sheet_info = self.get_sheet_info(sheet_id)
-            column_info = sheet_info.get('column_info', {})
-            
-            # Prepare new row models
-            new_rows = []
-            for data in row_data:
-                new_row = smartsheet.models.Row()
-                
-                # Handle hierarchy and positioning attributes
-                # Map camelCase API names to Python SDK attribute names
-                hierarchy_mapping = {
-                    'parentId': 'parent_id',
-                    'toTop': 'to_top', 
-                    'toBottom': 'to_bottom',
-                    'above': 'above',
-                    'below': 'below',
-                    'siblingId': 'sibling_id'
-                }
-                has_positioning = False
-                
-                for api_attr, sdk_attr in hierarchy_mapping.items():
-                    if api_attr in data:
-                        value = data[api_attr]
-                        # Convert parent_id to integer if it's a string
-                        if sdk_attr == 'parent_id' and isinstance(value, str):
-                            value = int(value)
-                        setattr(new_row, sdk_attr, value)
-                        has_positioning = True
-                
-                # If no positioning specified, default to bottom
-                if not has_positioning:
-                    new_row.to_bottom = True
-                
-                # Process regular cell data
-                cells = []
-                for field, value in data.items():
-                    # Skip hierarchy attributes and system-managed columns
-                    if field in hierarchy_mapping:
-                        continue
-                    if field in column_info and column_info[field].get('system_managed', False):
-                        continue
-                    
-                    if field in column_map:
-                        column_id = int(column_map[field])
-                        cell = self._create_cell(
-                            column_id,
-                            value,
-                            column_info.get(field, {})
-                        )
-                        cells.append(cell)
-                
-                new_row.cells = cells
-                new_rows.append(new_row)
-            
-            # Add the rows
-            result = self.client.Sheets.add_rows(sheet_id, new_rows)
-            
-            # Gather row IDs
-            row_ids = []
-            if isinstance(result, list):
-                for row_resp in result:
-                    if hasattr(row_resp, 'id'):
-                        row_ids.append(str(row_resp.id))
-            
-            return {
-                "message": "Successfully added rows",
-                "rows_added": len(new_rows),
-                "row_ids": row_ids
-            }
-            
+            with self.sheet_context(sheet_id, column_info) as ctx:
+                return self._add_rows_impl(ctx, row_data, column_map)
         except Exception as e:
             raise RuntimeError(f"Failed to add rows: {str(e)}")
 
+    def _add_rows_impl(
+        self,
+        ctx: "SheetContext",
+        row_data: List[Dict[str, Any]],
+        column_map: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Add rows using the column details already held by ctx."""
+        sheet_id = ctx.sheet_id
+        column_info = ctx.column_info
+        # Fields that become cells, resolved once for every row
+        cell_targets = self._cell_targets(
+            column_map,
+            column_info,
+            ctx.system_managed_fields | HIERARCHY_ATTRIBUTES.keys()
+        )
+        # Prepare new row models
+        new_rows = []
+        for data in row_data:
+            new_row = smartsheet.models.Row()
+            
+            # Handle hierarchy and positioning attributes
+            # Map camelCase API names to Python SDK attribute names
+            has_positioning = False
+            
+            for api_attr, sdk_attr in HIERARCHY_ATTRIBUTES.items():
+                if api_attr in data:
+                    value = data[api_attr]
+                    # Convert parent_id to integer if it's a string
+                    if sdk_attr == 'parent_id' and isinstance(value, str):
+                        value = int(value)
+                    setattr(new_row, sdk_attr, value)
+                    has_positioning = True
+            
+            # If no positioning specified, default to bottom
+            if not has_positioning:
+                new_row.to_bottom = True
+            
+            # Process regular cell data, skipping hierarchy attributes and
+            # system-managed columns
+            cells = []
+            for field, value in data.items():
+                target = cell_targets.get(field)
+                if target is None:
+                    continue
+                cells.append(self._create_cell(target[0], value, target[1]))
+            
+            new_row.cells = cells
+            new_rows.append(new_row)
+        
+        # Add the rows
+        result = self.client.Sheets.add_rows(sheet_id, new_rows)
+        self.invalidate_sheet_info(sheet_id, schema=False)
+        
+        # Gather row IDs
+        row_ids = []
+        if isinstance(result, list):
+            for row_resp in result:
+                if hasattr(row_resp, 'id'):
+                    row_ids.append(str(row_resp.id))
+        
+        return {
+            "message": "Successfully added rows",
+            "rows_added": len(new_rows),
+            "row_ids": row_ids
+        }
+
+    def _location_groups(
+        self,
+        row_data: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[List[int], bool]]:
+        """
+        Split rows into runs of consecutive rows with the same position.
+
+        The API only accepts one location per add_rows request, so each run
+        can be sent together.
+
+        Yields:
+            (row indices, whether rows added one at a time would end up in
+            reverse order)
+        """
+        indices: List[int] = []
+        location = None
+        for i, data in enumerate(row_data):
+            row_location = tuple(
+                (api_attr, str(data[api_attr]))
+                for api_attr in HIERARCHY_ATTRIBUTES
+                if api_attr in data
+            )
+            if indices and row_location != location:
+                yield indices, self._stacks_in_reverse(row_data[indices[0]])
+                indices = []
+            indices.append(i)
+            location = row_location
+        if indices:
+            yield indices, self._stacks_in_reverse(row_data[indices[0]])
+
+    def _stacks_in_reverse(self, data: Dict[str, Any]) -> bool:
+        """
+        Check if rows added one by one at this row's position stack in reverse.
+
+        That is the case when each row goes on top (toTop, or a parentId
+        alone, meaning first child) or directly below a sibling.
+        """
+        if data.get('siblingId') is not None:
+            return not data.get('above', False)
+        if data.get('toBottom', False):
+            return False
+        return bool(data.get('toTop', False)) or data.get('parentId') is not None
+
     def add_hierarchical_rows(
         self, 
         sheet_id: str, 
@@ -521,23 +1046,13 @@ class SmartsheetOperations:
             ]
         """
         try:
-            # This method creates rows in order, allowing parent IDs to be set
-            # as we create each level of the hierarchy
             created_rows = []
-            row_id_map = {}  # Track created row IDs for parent references
+            for wave in self.iter_add_hierarchical_rows(sheet_id, hierarchical_data, column_map):
+                created_rows.extend(wave['created_rows'])
             
-            for i, data in enumerate(hierarchical_data):
-                # Create a single row
-                result = self.add_rows(sheet_id, [data], column_map)
-                
-                if result.get('row_ids'):
-                    row_id = result['row_ids'][0]
-                    created_rows.append({
-                        'index': i,
-                        'row_id': row_id,
-                        'task_name': data.get('Task Name', f'Row {i+1}')
-                    })
-                    row_id_map[i] = row_id
+            created_rows.sort(key=operator.itemgetter('index'))
+            # Track created row IDs for parent references
+            row_id_map = {row['index']: row['row_id'] for row in created_rows}
             
             return {
                 "message": "Successfully added hierarchical rows",
@@ -549,19 +1064,65 @@ class SmartsheetOperations:
         except Exception as e:
             raise RuntimeError(f"Failed to add hierarchical rows: {str(e)}")
 
+    def iter_add_hierarchical_rows(
+        self,
+        sheet_id: str,
+        hierarchical_data: List[Dict[str, Any]],
+        column_map: Dict[str, str]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Add rows with hierarchical structure, yielding each request's rows as it completes.
+
+        Lets callers act on created rows while later requests are still to
+        be sent. Rows are sent as in add_hierarchical_rows; errors propagate
+        as raised.
+
+        Yields:
+            Dicts of the form {'wave': int, 'created_rows': [...]}, one per
+            add_rows request, with created_rows entries as in
+            add_hierarchical_rows
+        """
+        # Rows are created in order, allowing parent IDs to be set as we
+        # create each level of the hierarchy. Adding rows leaves the columns
+        # untouched, so one lookup serves every row.
+        with self.sheet_context(sheet_id) as ctx:
+            for wave, (indices, reverse) in enumerate(self._location_groups(hierarchical_data)):
+                # Send consecutive rows with the same position in one request.
+                # Adding one at a time stacks toTop/below rows in reverse,
+                # so send those reversed to end up with the same order.
+                if reverse:
+                    indices = indices[::-1]
+                result = ctx.add_rows([hierarchical_data[i] for i in indices], column_map)
+                
+                created_rows = [
+                    {
+                        'index': i,
+                        'row_id': row_id,
+                        'task_name': hierarchical_data[i].get('Task Name', f'Row {i+1}')
+                    }
+                    for i, row_id in zip(indices, result.get('row_ids', []))
+                ]
+                created_rows.sort(key=operator.itemgetter('index'))
+                yield {'wave': wave, 'created_rows': created_rows}
+
     def update_rows(
         self,
         sheet_id: str,
         updates: List[Dict[str, Any]],
-        column_map: Dict[str, str]
+        column_map: Dict[str, str],
+        column_info: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Update existing rows in a sheet.
 
+        More than UPDATE_ROWS_BATCH_SIZE updates are handed to
+        update_rows_bulk, since one request can't carry them all.
+
         Args:
             sheet_id: Smartsheet sheet ID
             updates: List of updates containing row_id and data
             column_map: Mapping of field names to column IDs
+            column_info: Column details from load_schema; fetched when omitted
 
         Returns:
             Dict containing success message and updated row information
@@ -569,80 +1130,211 @@ class SmartsheetOperations:
         Raises:
             RuntimeError: If update fails
         """
+        if len(updates) > UPDATE_ROWS_BATCH_SIZE:
+            return self.update_rows_bulk(sheet_id, updates, column_map, column_info=column_info)
         try:
             # Get sheet info for validation
-            sheet_info = self.get_sheet_info(sheet_id)
-            column_info = sheet_info.get('column_info', {})
+            with self.sheet_context(sheet_id, column_info) as ctx:
+                return self._update_rows_impl(ctx, updates, column_map)
+        except Exception as e:
+            raise RuntimeError(f"Failed to update rows: {str(e)}")
 
-            # Validate row IDs and prepare updates
-            valid_updates = []
-            validation_errors = []
+    def update_rows_bulk(
+        self,
+        sheet_id: str,
+        all_updates: List[Dict[str, Any]],
+        column_map: Dict[str, str],
+        batch_size: int = UPDATE_ROWS_BATCH_SIZE,
+        column_info: Optional[Dict[str, Any]] = None,
+        concurrency: int = UPDATE_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Update any number of rows, split into requests of at most batch_size.
 
-            for update in updates:
-                if not isinstance(update, dict) or 'row_id' not in update or 'data' not in update:
-                    validation_errors.append({
-                        'error': 'Invalid update format',
-                        'update': update
-                    })
-                    continue
+        Sheet info is fetched once for all batches, rather than once per
+        update_rows call, and up to concurrency batches are sent at a time.
+        A failed batch doesn't stop the others; it is reported under
+        failed_batches with the row IDs it didn't apply.
 
-                # Validate update data
-                is_valid, error = self._validate_update_data(update['data'], column_info)
-                if not is_valid:
-                    validation_errors.append({
-                        'row_id': update['row_id'],
-                        'error': error
-                    })
-                    continue
+        Args:
+            sheet_id: Smartsheet sheet ID
+            all_updates: List of updates containing row_id and data
+            column_map: Mapping of field names to column IDs
+            batch_size: Maximum rows per update request
+            column_info: Column details from load_schema; fetched when omitted
+            concurrency: Update requests sent in parallel
 
-                valid_updates.append(update)
+        Returns:
+            Dict containing success message and combined update information,
+            plus failed_batches ({'batch', 'error', 'row_ids'} per failed
+            request) when some batches failed
 
-            if not valid_updates:
-                return {
-                    'message': 'No valid updates to process',
-                    'rows_updated': 0,
-                    'validation_errors': validation_errors
-                }
+        Raises:
+            RuntimeError: If update fails, or if no batch succeeded
+        """
+        try:
+            if batch_size < 1:
+                raise ValueError("batch_size must be at least 1")
 
-            # Prepare row models for update
-            update_rows = []
-            for update in valid_updates:
-                row = self._prepare_update_row(
-                    update['row_id'],
-                    update['data'],
-                    column_map,
-                    column_info
-                )
-                update_rows.append(row)
+            row_ids = []
+            validation_errors = []
+            batches = [
+                all_updates[i:i + batch_size]
+                for i in range(0, len(all_updates), batch_size)
+            ]
+            # (result, error) per batch, in input order
+            outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = []
+            with self.sheet_context(sheet_id, column_info) as ctx:
+                if len(batches) == 1:
+                    try:
+                        outcomes.append((self._update_rows_impl(ctx, batches[0], column_map), None))
+                    except Exception as e:
+                        outcomes.append((None, e))
+                else:
+                    workers = max(1, min(concurrency, len(batches)))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(self._update_rows_impl, ctx, batch, column_map)
+                            for batch in batches
+                        ]
+                        # Earlier batches may already be written when one
+                        # fails, so every outcome is kept
+                        for future in futures:
+                            try:
+                                outcomes.append((future.result(), None))
+                            except Exception as e:
+                                outcomes.append((None, e))
 
-            # Perform updates
-            result = self.client.Sheets.update_rows(sheet_id, update_rows)
+            failed_batches: List[Dict[str, Any]] = []
+            first_error: Optional[Exception] = None
+            for index, (batch, (result, error)) in enumerate(zip(batches, outcomes)):
+                if result is None:
+                    logger.warning(f"Update batch {index} of sheet {sheet_id} failed: {str(error)}")
+                    failed_batches.append({
+                        'batch': index,
+                        'error': str(error),
+                        'row_ids': [
+                            str(update['row_id']) for update in batch
+                            if isinstance(update, dict) and 'row_id' in update
+                        ]
+                    })
+                    first_error = first_error or error
+                    continue
+                row_ids.extend(result.get('row_ids', []))
+                validation_errors.extend(result.get('validation_errors', []))
 
-            # Process results
-            row_ids = []
-            if isinstance(result, list):
-                for row_resp in result:
-                    if hasattr(row_resp, 'id'):
-                        row_ids.append(str(row_resp.id))
+            # Nothing was applied, so report the failure as before
+            if first_error is not None and len(failed_batches) == len(batches):
+                raise first_error
 
+            if failed_batches:
+                message = 'Partially updated rows'
+            elif row_ids:
+                message = 'Successfully updated rows'
+            else:
+                message = 'No valid updates to process'
             response = {
-                'message': 'Successfully updated rows',
+                'message': message,
                 'rows_updated': len(row_ids),
-                'row_ids': row_ids
+                'row_ids': row_ids,
+                'batches': len(batches)
             }
 
             if validation_errors:
                 response['validation_errors'] = validation_errors
+            if failed_batches:
+                response['failed_batches'] = failed_batches
 
             return response
 
         except Exception as e:
             raise RuntimeError(f"Failed to update rows: {str(e)}")
 
+    def _update_rows_impl(
+        self,
+        ctx: "SheetContext",
+        updates: List[Dict[str, Any]],
+        column_map: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Update rows using the column details already held by ctx."""
+        sheet_id = ctx.sheet_id
+        column_info = ctx.column_info
+
+        # Validate row IDs and prepare updates
+        valid_updates = []
+        validation_errors: List[Dict[str, Any]] = []
+
+        for update in updates:
+            if not isinstance(update, dict) or 'row_id' not in update or 'data' not in update:
+                validation_errors.append({
+                    'error': 'Invalid update format',
+                    'update': update
+                })
+                continue
+
+            # Validate update data
+            is_valid, error = self._validate_update_data(
+                update['data'],
+                column_info,
+                ctx.picklist_options,
+                ctx.system_managed_fields
+            )
+            if not is_valid:
+                validation_errors.append({
+                    'row_id': update['row_id'],
+                    'error': error
+                })
+                continue
+
+            valid_updates.append(update)
+
+        if not valid_updates:
+            return {
+                'message': 'No valid updates to process',
+                'rows_updated': 0,
+                'validation_errors': validation_errors
+            }
+
+        # Prepare row models for update, resolving cell columns once
+        cell_targets = self._cell_targets(column_map, column_info, ctx.system_managed_fields)
+        update_rows = []
+        for update in valid_updates:
+            row = self._prepare_update_row(
+                update['row_id'],
+                update['data'],
+                column_map,
+                column_info,
+                cell_targets=cell_targets
+            )
+            update_rows.append(row)
+
+        # Perform updates
+        result = self.client.Sheets.update_rows(sheet_id, update_rows)
+        self.invalidate_sheet_info(sheet_id, schema=False)
+
+        # Process results
+        row_ids = []
+        if isinstance(result, list):
+            for row_resp in result:
+                if hasattr(row_resp, 'id'):
+                    row_ids.append(str(row_resp.id))
+
+        response = {
+            'message': 'Successfully updated rows',
+            'rows_updated': len(row_ids),
+            'row_ids': row_ids
+        }
+
+        if validation_errors:
+            response['validation_errors'] = validation_errors
+
+        return response
+
     def delete_rows(
         self,
         sheet_id: str,
-        row_ids: List[str]
+        row_ids: List[str],
+        validate: bool = True
     ) -> Dict[str, Any]:
         """
         Delete rows from a sheet.
@@ -650,6 +1342,9 @@ class SmartsheetOperations:
         Args:
             sheet_id: Smartsheet sheet ID
             row_ids: List of row IDs to delete
+            validate: Check the row IDs exist before deleting (default).
+                Pass False to skip the lookup and let the API skip missing
+                rows, reporting only the rows it confirms as deleted.
 
         Returns:
             Dict containing success message and deletion details
@@ -658,8 +1353,50 @@ class SmartsheetOperations:
             RuntimeError: If deletion fails
         """
         try:
-            # Validate row IDs
-            valid_ids, errors = self._validate_row_ids(sheet_id, row_ids)
+            if validate:
+                # Validate row IDs
+                valid_ids, errors = self._validate_row_ids(sheet_id, row_ids)
+            else:
+                valid_ids, errors = self._numeric_row_ids(row_ids)
+
+            # Perform deletion
+            if valid_ids and validate:
+                self.client.Sheets.delete_rows(sheet_id, valid_ids)
+                self.invalidate_sheet_info(sheet_id, schema=False)
+            elif valid_ids:
+                result = self.client.Sheets.delete_rows(
+                    sheet_id,
+                    [int(row_id) for row_id in valid_ids],
+                    ignore_rows_not_found=True
+                )
+                self.invalidate_sheet_info(sheet_id, schema=False)
+                
+                # Missing rows were skipped; only report rows the API
+                # confirms as deleted
+                deleted_ids = self._deleted_row_ids(result)
+                if deleted_ids is None:
+                    logger.warning(
+                        f"Could not read deleted row IDs from delete_rows response for sheet {sheet_id}; "
+                        f"marking {len(valid_ids)} rows as unconfirmed"
+                    )
+                    errors.extend(
+                        {'row_id': row_id, 'reason': 'Deletion not confirmed'}
+                        for row_id in valid_ids
+                    )
+                    return {
+                        'message': 'Deletion not confirmed',
+                        'rows_deleted': 0,
+                        'failed_deletes': errors
+                    }
+                errors.extend(
+                    {'row_id': row_id, 'reason': 'Row not found'}
+                    for row_id in valid_ids
+                    if str(int(row_id)) not in deleted_ids
+                )
+                valid_ids = [
+                    row_id for row_id in valid_ids
+                    if str(int(row_id)) in deleted_ids
+                ]
 
             if not valid_ids:
                 return {
@@ -668,9 +1405,6 @@ class SmartsheetOperations:
                     'failed_deletes': errors
                 }
 
-            # Perform deletion
-            self.client.Sheets.delete_rows(sheet_id, valid_ids)
-
             response = {
                 'message': 'Successfully deleted rows',
                 'rows_deleted': len(valid_ids)
@@ -684,10 +1418,40 @@ class SmartsheetOperations:
         except Exception as e:
             raise RuntimeError(f"Failed to delete rows: {str(e)}")
 
+    def _numeric_row_ids(self, row_ids: List[str]) -> Tuple[List[str], List[Dict[str, str]]]:
+        """Split row IDs into ones that can be sent to the API and errors for the rest."""
+        valid_ids = []
+        errors = []
+        for row_id in row_ids:
+            try:
+                int(row_id)
+            except (TypeError, ValueError):
+                errors.append({
+                    'row_id': row_id,
+                    'reason': 'Row not found'
+                })
+            else:
+                valid_ids.append(row_id)
+        return valid_ids, errors
+
+    def _deleted_row_ids(self, result: Any) -> Optional[Set[str]]:
+        """
+        Get the IDs of rows a delete_rows response reports as deleted.
+
+        Returns None if the response doesn't list them, in which case no
+        row can be assumed deleted.
+        """
+        deleted = getattr(result, 'result', None)
+        if not isinstance(deleted, list):
+            return None
+        return {str(getattr(row_id, 'value', row_id)) for row_id in deleted}
+
     def _validate_update_data(
         self,
         data: Dict[str, Any],
-        column_info: Dict[str, Any]
+        column_info: Dict[str, Any],
+        valid_options_by_field: Optional[Dict[str, frozenset]] = None,
+        system_managed_fields: Optional[frozenset] = None
     ) -> Tuple[bool, Optional[str]]:
         """
         Validate update data against column types.
@@ -695,24 +1459,31 @@ class SmartsheetOperations:
         Args:
             data: Update data to validate
             column_info: Column information from get_sheet_info
+            valid_options_by_field: PICKLIST options per field, as built by
+                _picklist_options; computed from column_info when omitted
+            system_managed_fields: Fields that cannot be updated; computed
+                from column_info when omitted
 
         Returns:
             Tuple of (is_valid: bool, error_message: Optional[str])
         """
         try:
+            if valid_options_by_field is None:
+                valid_options_by_field = self._picklist_options(column_info)
+            if system_managed_fields is None:
+                system_managed_fields = self._system_managed_fields(column_info)
+
             for field, value in data.items():
                 if field not in column_info:
                     return False, f"Unknown field: {field}"
 
-                field_info = column_info[field]
-
                 # Skip validation for system-managed columns
-                if field_info.get('system_managed', False):
+                if field in system_managed_fields:
                     return False, f"Cannot update system-managed field: {field}"
 
                 # Validate multi-select fields
-                if field_info.get('type') == 'PICKLIST' and isinstance(value, list):
-                    options = field_info.get('options', [])
+                options = valid_options_by_field.get(field)
+                if options is not None and isinstance(value, list):
                     for item in value:
                         if str(item) not in options:
                             return False, f"Invalid option '{item}' for field: {field}"
@@ -722,12 +1493,38 @@ class SmartsheetOperations:
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
+    def _system_managed_fields(self, column_info: Dict[str, Any]) -> frozenset:
+        """Return the fields whose columns are system-managed."""
+        return frozenset(
+            field for field, info in column_info.items()
+            if info.get('system_managed', False)
+        )
+
+    def _formula_references(self, column_info: Dict[str, Any]) -> Dict[str, Tuple[str, ...]]:
+        """Map each column title referenced by a formula to the titles of the formula columns using it."""
+        references: Dict[str, List[str]] = {}
+        for field, info in column_info.items():
+            if info.get('formula'):
+                for dependency in info.get('dependencies', ()):
+                    references.setdefault(dependency, []).append(field)
+        return {title: tuple(fields) for title, fields in references.items()}
+
+    def _picklist_options(self, column_info: Dict[str, Any]) -> Dict[str, frozenset]:
+        """Map each PICKLIST field to the set of its allowed options."""
+        return {
+            field: frozenset(info.get('options', []))
+            for field, info in column_info.items()
+            if info.get('type') == 'PICKLIST'
+        }
+
     def _prepare_update_row(
         self,
         row_id: str,
         data: Dict[str, Any],
-        column_map: Dict[str, str],
-        column_info: Dict[str, Any]
+        column_map: Mapping[str, Union[str, int]],
+        column_info: Dict[str, Any],
+        system_managed_fields: Optional[frozenset] = None,
+        cell_targets: Optional[Dict[str, Tuple[int, Dict[str, Any]]]] = None
     ) -> smartsheet.models.Row:
         """
         Prepare a row model for update.
@@ -737,168 +1534,524 @@ class SmartsheetOperations:
             data: Update data
             column_map: Column mapping
             column_info: Column information
+            system_managed_fields: Fields to skip; derived from column_info
+                when omitted
+            cell_targets: Prebuilt _cell_targets for a batch of rows; built
+                from the other arguments when omitted
 
         Returns:
             Configured Row model ready for update
         """
+        if cell_targets is None:
+            if system_managed_fields is None:
+                system_managed_fields = self._system_managed_fields(column_info)
+            cell_targets = self._cell_targets(column_map, column_info, system_managed_fields)
+
         new_row = smartsheet.models.Row()
         new_row.id_ = int(row_id)
 
+        # Skip system-managed and unmapped columns
         cells = []
         for field, value in data.items():
-            # Skip system-managed columns
-            if field in column_info and column_info[field].get('system_managed', False):
+            target = cell_targets.get(field)
+            if target is None:
                 continue
+            cells.append(self._create_cell(target[0], value, target[1]))
+
+        new_row.cells = cells
+        return new_row
+
+    def _cell_targets(
+        self,
+        column_map: Mapping[str, Union[str, int]],
+        column_info: Dict[str, Any],
+        skip_fields: Union[Set[str], frozenset]
+    ) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+        """Map each field that becomes a cell to its int column id and column info."""
+        no_info: Dict[str, Any] = {}
+        return {
+            field: (int(column_id), column_info.get(field, no_info))
+            for field, column_id in column_map.items()
+            if field not in skip_fields
+        }
+
+    def search_sheet(
+        self,
+        sheet_id: str,
+        pattern: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Search a sheet using a pattern.
+        
+        Args:
+            sheet_id: Smartsheet sheet ID
+            pattern: Search pattern (text/regex)
+            options: Optional search configuration
+                {
+                    'columns': List[str] | None,  # Specific columns to search, or None for all
+                    'case_sensitive': bool,       # Case sensitive search
+                    'regex': bool,                # Use regex pattern matching
+                    'whole_word': bool,           # Match whole words only
+                    'include_system': bool,       # Include system-managed columns
+                    'engine': 're' | 'hyperscan' | 're2',
+                                                  # Regex engine; default is re with
+                                                  # a hyperscan prefilter when
+                                                  # installed. 're2' opts regex
+                                                  # searches into linear-time RE2
+                                                  # (ASCII-only word classes)
+                    'context_chars': int | None,  # Context kept on each side of a
+                                                  # match (default SEARCH_CONTEXT_CHARS,
+                                                  # None for the rest of the cell)
+                    'ids_only': bool              # Only find matching row IDs; stops
+                                                  # at each row's first match and
+                                                  # leaves 'matches' empty
+                }
+        
+        Returns:
+            Dict containing matches and metadata
+        """
+        try:
+            summary: Dict[str, Any] = {}
+            # Not compact, so every entry is a dict
+            matches = cast(
+                List[Dict[str, Any]],
+                list(self.iter_search_matches(sheet_id, pattern, options, summary))
+            )
+            
+            # Extract row IDs from matches
+            matched_row_ids = [match['row_id'] for match in matches]
+            if (options or {}).get('ids_only', False):
+                matches = []
+            
+            return {
+                'row_ids': matched_row_ids,  # Primary result - list of matching row IDs
+                'matches': matches,  # Detailed match information
+                'metadata': {
+                    'sheet_info': {
+                        'total_rows': summary['total_rows'],
+                        'total_columns': summary['total_columns'],
+                        'column_types': {
+                            title: info.get('type', 'TEXT_NUMBER')
+                            for title, info in summary['column_info'].items()
+                        }
+                    },
+                    'search_info': {
+                        'matched_rows': len(matched_row_ids),
+                        'columns_searched': sorted(list(summary['columns_searched'])),
+                        'pattern_used': summary['pattern_used']
+                    }
+                }
+            }
+            
+        except Exception as e:
+            raise RuntimeError(f"Failed to search sheet: {str(e)}")
+
+    def iter_search_matches(
+        self,
+        sheet_id: str,
+        pattern: str,
+        options: Optional[Dict[str, Any]] = None,
+        summary: Optional[Dict[str, Any]] = None,
+        compact: bool = False
+    ) -> Iterator[Union[Dict[str, Any], Tuple[str, List[SearchMatch]]]]:
+        """
+        Lazily search a sheet page by page, yielding one entry per matching row.
+
+        Only one page of rows (SEARCH_PAGE_SIZE) is held at a time, and callers
+        that stop iterating early skip fetching the remaining pages.
+
+        Args:
+            sheet_id: Smartsheet sheet ID
+            pattern: Search pattern (text/regex)
+            options: Search configuration, as for search_sheet
+            summary: Optional dict filled in with 'pattern_used', 'column_info',
+                'total_columns', 'total_rows' (rows seen so far) and
+                'columns_searched'
+            compact: Yield (row_id, [SearchMatch, ...]) tuples instead of
+                dicts, avoiding per-match dict allocation for large result
+                sets; search_match_to_dict converts them when needed. With
+                options['ids_only'] the match lists are empty.
+
+        Yields:
+            Dicts of the form {'row_id': str, 'matches': [...]}
+        """
+        summary = summary if summary is not None else {}
+        
+        # Process options
+        options = options or {}
+        columns_to_search = options.get('columns')
+        case_sensitive = options.get('case_sensitive', False)
+        use_regex = options.get('regex', False)
+        whole_word = options.get('whole_word', False)
+        include_system = options.get('include_system', False)
+        context_chars = options.get('context_chars', SEARCH_CONTEXT_CHARS)
+        ids_only = options.get('ids_only', False)
+        
+        # Prepare pattern
+        raw_pattern = pattern
+        flags = 0 if case_sensitive else re.IGNORECASE
+        # RE2's semantics differ slightly from re's, so it is only used on request
+        use_re2 = re2 is not None and use_regex and options.get('engine') == 're2'
+        pattern_re = compile_search_pattern(raw_pattern, flags, whole_word, use_regex, use_re2)
+        # RE2 needs no prefilter, and Hyperscan only understands re patterns
+        use_hyperscan = (
+            hyperscan is not None
+            and isinstance(pattern_re, re.Pattern)
+            and options.get('engine') in (None, 'hyperscan')
+        )
+        pattern = pattern_re.pattern
+        scan_once = not use_regex and SEARCH_SEPARATOR not in raw_pattern
+        
+        columns_searched: Set[str] = set()
+        summary['pattern_used'] = pattern
+        summary['columns_searched'] = columns_searched
+        summary['total_rows'] = 0
+        
+        searchable_columns = None
+        column_for_id: Dict[Any, Any] = {}
+        
+        # When only some columns are searched, have the API send just their
+        # cells. Their ids come from the (usually cached) sheet info.
+        page_options: Dict[str, Any] = {'level': 2, 'include': 'objectValue'}
+        total_columns = None
+        if columns_to_search:
+            column_map = self._sheet_info(sheet_id).get('column_map') or {}
+            column_ids = [column_map[title] for title in columns_to_search if title in column_map]
+            if column_ids:
+                page_options['column_ids'] = ','.join(column_ids)
+                total_columns = len(column_map)
+        
+        # Get the rows page by page, including what column details need
+        for page in self._iter_sheet_pages(sheet_id, **page_options):
+            if searchable_columns is None:
+                # Reuse cached column details, or build them from the first page
+                sheet_info = self._get_cached_sheet_info(sheet_id)
+                if sheet_info is None:
+                    sheet_info = self._build_sheet_info(sheet_id, page)
+                    # A projected page's sample rows only hold some columns
+                    if 'column_ids' not in page_options:
+                        self._cache_sheet_info(sheet_id, sheet_info)
+                column_info = sheet_info.get('column_info', {})
+                summary['column_info'] = column_info
+                summary['total_columns'] = total_columns if total_columns is not None else len(page.columns)
+                
+                # Decide once per column whether it is searched, instead of per cell:
+                # str(column id) -> (column title, is PICKLIST)
+                wanted_columns = set(columns_to_search) if columns_to_search else None
+                searchable_columns = {}
+                for title, info in column_info.items():
+                    if wanted_columns is not None and title not in wanted_columns:
+                        continue
+                    if not include_system and info.get('system_managed', False):
+                        continue
+                    searchable_columns[str(info['id'])] = (title, info.get('type') == "PICKLIST")
+            
+            rows = page.rows
+            summary['total_rows'] += len(rows)
+            
+            # Collect the cells to search in row/cell order as parallel lists,
+            # resolving each raw cell.column_id only the first time it is seen
+            cell_rows = []
+            cell_columns = []
+            cell_values = []
+            cell_texts = []
+            cell_is_picklist = []
+            for row_index, row in enumerate(rows):
+                for cell in row.cells:
+                    column_id = cell.column_id
+                    column = column_for_id.get(column_id, _MISSING)
+                    if column is _MISSING:
+                        column = column_for_id[column_id] = searchable_columns.get(str(column_id))
+                        if column is not None:
+                            columns_searched.add(column[0])
+                    if column is None:
+                        continue
+                    
+                    # Get cell value
+                    value = cell.value
+                    if value is None:
+                        continue
+                    
+                    cell_rows.append(row_index)
+                    cell_columns.append(column[0])
+                    cell_values.append(value)
+                    cell_texts.append(str(value))
+                    cell_is_picklist.append(column[1])
+            
+            if ids_only:
+                # Only which rows match is needed: stop at each row's first
+                # match, and skip text cells of rows a PICKLIST cell matched
+                matched_rows = {
+                    row_index for row_index, str_value, is_picklist
+                    in zip(cell_rows, cell_texts, cell_is_picklist)
+                    if is_picklist and str_value == raw_pattern
+                }
+                text_cells = [
+                    (row_index, str_value) for row_index, str_value, is_picklist
+                    in zip(cell_rows, cell_texts, cell_is_picklist)
+                    if not is_picklist and row_index not in matched_rows
+                ]
+                matched_rows.update(self._find_matching_rows(
+                    pattern_re,
+                    [str_value for _, str_value in text_cells],
+                    [row_index for row_index, _ in text_cells],
+                    scan_once=scan_once,
+                    use_hyperscan=use_hyperscan
+                ))
+                for row_index in sorted(matched_rows):
+                    row_id = str(rows[row_index].id)
+                    yield (row_id, []) if compact else {'row_id': row_id, 'matches': []}
+                continue
+            
+            # Regex-search every non-PICKLIST cell. Escaped literals can't match
+            # across the separator, so those are scanned in one pass.
+            text_spans = iter(self._find_pattern_spans(
+                pattern_re,
+                [text for text, is_picklist in zip(cell_texts, cell_is_picklist) if not is_picklist],
+                scan_once=scan_once,
+                use_hyperscan=use_hyperscan
+            ))
+            
+            row_matches_by_index: Dict[int, List[SearchMatch]] = {}
+            for row_index, column_title, value, str_value, is_picklist in zip(
+                cell_rows, cell_columns, cell_values, cell_texts, cell_is_picklist
+            ):
+                # For PICKLIST columns, do exact comparison against the
+                # user's pattern (before escaping/word-boundary wrapping)
+                if is_picklist:
+                    spans = [(0, len(str_value), str_value)] if str_value == raw_pattern else []
+                else:
+                    spans = [(start, end, str_value[start:end]) for start, end in next(text_spans)]
+                
+                for start, end, matched_text in spans:
+                    # Bounded context keeps each match's size independent of
+                    # the cell's length
+                    if context_chars is None:
+                        before, after = str_value[:start], str_value[end:]
+                    else:
+                        before = str_value[max(0, start - context_chars):start]
+                        after = str_value[end:end + context_chars]
+                    row_matches_by_index.setdefault(row_index, []).append(SearchMatch(
+                        column_title,
+                        value,
+                        matched_text,
+                        before,
+                        after,
+                        (start, end)
+                    ))
+            
+            for row_index, row_matches in row_matches_by_index.items():
+                row_id = str(rows[row_index].id)
+                if compact:
+                    yield row_id, row_matches
+                else:
+                    yield {
+                        'row_id': row_id,
+                        'matches': [search_match_to_dict(match) for match in row_matches]
+                    }
+
+    def _iter_sheet_pages(
+        self,
+        sheet_id: str,
+        page_size: int = SEARCH_PAGE_SIZE,
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Fetch a sheet one page of rows at a time.
+
+        Every page carries the sheet's columns. Stops after a short page or
+        once total_row_count rows have been requested.
+        """
+        page = 1
+        while True:
+            sheet = self.client.Sheets.get_sheet(
+                sheet_id,
+                page_size=page_size,
+                page=page,
+                **kwargs
+            )
+            yield sheet
+            
+            rows = getattr(sheet, 'rows', None) or []
+            total_row_count = getattr(sheet, 'total_row_count', None)
+            if len(rows) < page_size:
+                return
+            if isinstance(total_row_count, int) and page * page_size >= total_row_count:
+                return
+            page += 1
+
+    def _find_pattern_spans(
+        self,
+        pattern_re: "re.Pattern",
+        values: List[str],
+        scan_once: bool = False,
+        use_hyperscan: bool = False
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Find all regex matches in each of the given strings.
+
+        Args:
+            pattern_re: Compiled search pattern
+            values: Strings to search
+            scan_once: Join the values with SEARCH_SEPARATOR and run a single
+                finditer over the buffer. Only valid when the pattern cannot
+                match across the separator (e.g. an escaped literal).
+            use_hyperscan: When not scanning once, let Hyperscan pick out the
+                values that may match so re only runs on those
+
+        Returns:
+            One list of (start, end) spans per value, relative to that value
+        """
+        spans: List[List[Tuple[int, int]]] = [[] for _ in values]
+        if not values:
+            return spans
+        
+        if not scan_once:
+            candidates = self._hyperscan_candidates(pattern_re, values) if use_hyperscan else None
+            for i, text in enumerate(values):
+                if candidates is not None and i not in candidates:
+                    continue
+                spans[i] = [match.span() for match in pattern_re.finditer(text)]
+            return spans
+        
+        # Offset of each value within the joined buffer
+        starts = []
+        offset = 0
+        for text in values:
+            starts.append(offset)
+            offset += len(text) + len(SEARCH_SEPARATOR)
+        
+        buffer = SEARCH_SEPARATOR.join(values)
+        for match in pattern_re.finditer(buffer):
+            i = bisect.bisect_right(starts, match.start()) - 1
+            spans[i].append((match.start() - starts[i], match.end() - starts[i]))
+        return spans
+
+    def _find_matching_rows(
+        self,
+        pattern_re: "re.Pattern",
+        values: List[str],
+        value_rows: List[int],
+        scan_once: bool = False,
+        use_hyperscan: bool = False
+    ) -> Set[int]:
+        """
+        Find which rows have a regex match, moving on to the next row after each row's first match.
+
+        Args:
+            pattern_re: Compiled search pattern
+            values: Strings to search, grouped by row
+            value_rows: Row index of each value, in non-decreasing order
+            scan_once: As for _find_pattern_spans; each search resumes at
+                the next row's first value
+            use_hyperscan: As for _find_pattern_spans
+
+        Returns:
+            Set of the row indexes with at least one match
+        """
+        matched_rows: Set[int] = set()
+        if not values:
+            return matched_rows
+        
+        if not scan_once:
+            candidates = self._hyperscan_candidates(pattern_re, values) if use_hyperscan else None
+            for i, text in enumerate(values):
+                row_index = value_rows[i]
+                if row_index in matched_rows or (candidates is not None and i not in candidates):
+                    continue
+                if pattern_re.search(text):
+                    matched_rows.add(row_index)
+            return matched_rows
+        
+        # Offset of each value within the joined buffer
+        starts = []
+        offset = 0
+        for text in values:
+            starts.append(offset)
+            offset += len(text) + len(SEARCH_SEPARATOR)
+        
+        buffer = SEARCH_SEPARATOR.join(values)
+        pos = 0
+        while True:
+            match = pattern_re.search(buffer, pos)
+            if match is None:
+                break
+            row_index = value_rows[bisect.bisect_right(starts, match.start()) - 1]
+            matched_rows.add(row_index)
+            # Skip the rest of this row's values
+            next_value = bisect.bisect_right(value_rows, row_index)
+            if next_value >= len(values):
+                break
+            pos = starts[next_value]
+        return matched_rows
+
+    def _hyperscan_candidates(
+        self,
+        pattern_re: "re.Pattern",
+        values: List[str]
+    ) -> Optional[Set[int]]:
+        """
+        Find the indexes of values that may match, using one Hyperscan pass.
 
-            if field in column_map:
-                column_id = int(column_map[field])
-                cell = self._create_cell(
-                    column_id,
-                    value,
-                    column_info.get(field, {})
-                )
-                cells.append(cell)
+        The pattern is compiled in prefilter mode, which can report false
+        positives, so re still produces the final spans. Values are joined
+        with newlines and scanned in multiline mode so ^ and $ anchor at
+        each value.
 
-        new_row.cells = cells
-        return new_row
+        Hyperscan must never drop a value re would match, so it is only
+        trusted where the two engines agree: patterns using whole-buffer
+        anchors (\\A, \\Z), Python-only syntax ({,n}) or matching the empty
+        string are left to re, and so are case-insensitive non-ASCII
+        patterns. Values that aren't printable ASCII (where Unicode case
+        folding and character classes differ) are always candidates.
 
-    def search_sheet(
-        self,
-        sheet_id: str,
-        pattern: str,
-        options: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        Returns:
+            Set of candidate indexes, or None if Hyperscan cannot handle the
+            pattern and every value should be searched
         """
-        Search a sheet using a pattern.
+        if (
+            hyperscan is None
+            or HYPERSCAN_UNSAFE_SYNTAX_RE.search(pattern_re.pattern)
+            or pattern_re.search('') is not None
+            or (pattern_re.flags & re.IGNORECASE and not pattern_re.pattern.isascii())
+        ):
+            return None
         
-        Args:
-            sheet_id: Smartsheet sheet ID
-            pattern: Search pattern (text/regex)
-            options: Optional search configuration
-                {
-                    'columns': List[str] | None,  # Specific columns to search, or None for all
-                    'case_sensitive': bool,       # Case sensitive search
-                    'regex': bool,                # Use regex pattern matching
-                    'whole_word': bool,           # Match whole words only
-                    'include_system': bool        # Include system-managed columns
-                }
+        flags = (
+            hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_MULTILINE
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        if pattern_re.flags & re.IGNORECASE:
+            flags |= hyperscan.HS_FLAG_CASELESS
         
-        Returns:
-            Dict containing matches and metadata
-        """
         try:
-            # Get sheet info for column details
-            sheet_info = self.get_sheet_info(sheet_id)
-            column_info = sheet_info.get('column_info', {})
-            
-            # Process options
-            options = options or {}
-            columns_to_search = options.get('columns')
-            case_sensitive = options.get('case_sensitive', False)
-            use_regex = options.get('regex', False)
-            whole_word = options.get('whole_word', False)
-            include_system = options.get('include_system', False)
-            
-            # Get the sheet with all rows
-            sheet = self.client.Sheets.get_sheet(sheet_id)
-            
-            # Prepare pattern
-            if not use_regex:
-                pattern = re.escape(pattern)
-            if whole_word:
-                pattern = fr'\b{pattern}\b'
-            flags = 0 if case_sensitive else re.IGNORECASE
-            pattern_re = re.compile(pattern, flags)
-            
-            # Track matches
-            matches = []
-            columns_searched = set()
-            
-            # Search each row
-            for row in sheet.rows:
-                row_matches = []
-                
-                for cell in row.cells:
-                    # Find column info
-                    column_title = None
-                    column_type = None
-                    for title, info in column_info.items():
-                        if str(info['id']) == str(cell.column_id):
-                            column_title = title
-                            column_type = info.get('type')
-                            break
-                    
-                    if not column_title:
-                        continue
-                        
-                    # Check if we should search this column
-                    if columns_to_search and column_title not in columns_to_search:
-                        continue
-                        
-                    # Skip system columns if not included
-                    if not include_system and column_info.get(column_title, {}).get('system_managed', False):
-                        continue
-                    
-                    columns_searched.add(column_title)
-                    
-                    # Get cell value
-                    value = cell.value
-                    if value is None:
-                        continue
-                    
-                    # For PICKLIST columns, do exact value comparison
-                    if column_type == "PICKLIST":
-                        if str(value) == pattern:
-                            matches_found = [type('Match', (), {'group': lambda x: value, 'start': lambda: 0, 'end': lambda: len(str(value))})]
-                        else:
-                            matches_found = []
-                    else:
-                        # For other columns, use regex search
-                        str_value = str(value)
-                        matches_found = list(pattern_re.finditer(str_value))
-                    if matches_found:
-                        for match in matches_found:
-                            row_matches.append({
-                                'column': column_title,
-                                'value': value,
-                                'matched_text': match.group(0),
-                                'context': {
-                                    'before': str_value[:match.start()],
-                                    'after': str_value[match.end():]
-                                }
-                            })
-                
-                if row_matches:
-                    matches.append({
-                        'row_id': str(row.id),
-                        'matches': row_matches
-                    })
-            
-            # Extract row IDs from matches
-            matched_row_ids = [match['row_id'] for match in matches]
-            
-            return {
-                'row_ids': matched_row_ids,  # Primary result - list of matching row IDs
-                'matches': matches,  # Detailed match information
-                'metadata': {
-                    'sheet_info': {
-                        'total_rows': len(sheet.rows),
-                        'total_columns': len(sheet.columns),
-                        'column_types': {
-                            title: info.get('type', 'TEXT_NUMBER')
-                            for title, info in column_info.items()
-                        }
-                    },
-                    'search_info': {
-                        'matched_rows': len(matches),
-                        'columns_searched': sorted(list(columns_searched)),
-                        'pattern_used': pattern
-                    }
-                }
-            }
-            
-        except Exception as e:
-            raise RuntimeError(f"Failed to search sheet: {str(e)}")
+            db = hyperscan.Database()
+            db.compile(expressions=[pattern_re.pattern.encode('utf-8')], ids=[0], flags=[flags])
+        except hyperscan.error as e:
+            logger.debug(f"Hyperscan rejected pattern, using re: {e}")
+            return None
+        
+        # Byte offset of each value within the joined buffer
+        encoded = [text.encode('utf-8') for text in values]
+        starts = []
+        offset = 0
+        for data in encoded:
+            starts.append(offset)
+            offset += len(data) + 1
+        
+        candidates = {
+            i for i, text in enumerate(values)
+            if not (text.isascii() and text.isprintable())
+        }
+        
+        def on_match(pattern_id, start, end, flags, context):
+            candidates.add(bisect.bisect_right(starts, max(end - 1, 0)) - 1)
+        
+        db.scan(b'\n'.join(encoded), match_event_handler=on_match)
+        return candidates
 
     def add_column(
         self,
@@ -925,8 +2078,10 @@ class SmartsheetOperations:
         """
         try:
             # Get current sheet info to validate column count
-            sheet = self.client.Sheets.get_sheet(sheet_id)
-            if len(sheet.columns) >= 400:
+            sheet_info = self._sheet_info(sheet_id)
+            if 'error' in sheet_info:
+                raise ValueError(sheet_info['error'])
+            if len(sheet_info.get('column_map', {})) >= 400:
                 raise ValueError("Maximum column limit (400) reached")
 
             # Create column object
@@ -944,6 +2099,7 @@ class SmartsheetOperations:
 
             # Add the column
             result = self.client.Sheets.add_columns(sheet_id, [column])
+            self.invalidate_sheet_info(sheet_id)
 
             # Get the new column info
             if isinstance(result, list) and result:
@@ -1008,19 +2164,26 @@ class SmartsheetOperations:
         """
         try:
             if validate_dependencies:
-                # Get sheet info to check dependencies
-                sheet_info = self.get_sheet_info(sheet_id)
-                dependencies = []
+                # Only column definitions are needed, not rows
+                schema = self._get_sheet_schema(sheet_id)
+                if "error" in schema:
+                    raise RuntimeError(schema["error"])
 
-                # Check each column for formulas that reference this column
-                for col_name, col_info in sheet_info['column_info'].items():
-                    if col_info.get('type') == 'FORMULA':
-                        formula = col_info.get('formula', '')
-                        if f'[{column_id}]' in formula:
-                            dependencies.append({
-                                'column': col_name,
-                                'type': 'formula_reference'
-                            })
+                # Formulas reference columns by title, e.g. [Task Name]@row
+                target_title = None
+                for title, info in schema.get('column_info', {}).items():
+                    if str(info.get('id')) == str(column_id):
+                        target_title = title
+                        break
+
+                # Look up the formula columns that reference this column
+                dependencies = []
+                if target_title:
+                    for title in schema.get('formula_references', {}).get(target_title, ()):
+                        dependencies.append({
+                            'column': title,
+                            'type': 'formula_reference'
+                        })
 
                 if dependencies:
                     return {
@@ -1030,6 +2193,7 @@ class SmartsheetOperations:
 
             # Delete the column
             self.client.Sheets.delete_column(sheet_id, column_id)
+            self.invalidate_sheet_info(sheet_id)
 
             return {
                 "message": "Successfully deleted column",
@@ -1059,8 +2223,10 @@ class SmartsheetOperations:
             Dict containing success message and update details
         """
         try:
-            # Get current sheet info
-            sheet_info = self.get_sheet_info(sheet_id)
+            # Get current columns; sample rows aren't needed
+            sheet_info = self._get_sheet_schema(sheet_id)
+            if "error" in sheet_info:
+                raise RuntimeError(sheet_info["error"])
             
             # Find current column title
             old_title = None
@@ -1079,26 +2245,59 @@ class SmartsheetOperations:
 
             # Update the column
             self.client.Sheets.update_column(sheet_id, int(column_id), column)
+            self.invalidate_sheet_info(sheet_id)
 
             updated_references = []
             if update_references:
                 # Update formula references in other columns
-                for col_name, col_info in sheet_info['column_info'].items():
-                    if col_info.get('type') == 'FORMULA':
-                        formula = col_info.get('formula', '')
-                        if f'[{old_title}]' in formula:
-                            # Update formula to use new title
-                            new_formula = formula.replace(f'[{old_title}]', f'[{new_title}]')
-                            update_col = smartsheet.models.Column({
-                                'id': int(col_info['id']),
-                                'formula': new_formula
-                            })
-                            self.client.Sheets.update_column(sheet_id, update_col)
-                            updated_references.append({
-                                'column': col_name,
-                                'old_formula': formula,
-                                'new_formula': new_formula
-                            })
+                old_token = f'[{old_title}]'
+                new_token = f'[{new_title}]'
+                column_info = sheet_info['column_info']
+                reference_updates = []
+                for col_name in sheet_info.get('formula_references', {}).get(old_title, ()):
+                    col_info = column_info[col_name]
+                    formula = col_info['formula']
+                    if old_token in formula:
+                        # Update formula to use new title
+                        new_formula = formula.replace(old_token, new_token)
+                        reference_updates.append((col_name, int(col_info['id']), formula, new_formula))
+
+                if reference_updates:
+                    # The API has no bulk column update, so send the
+                    # per-column requests concurrently. The column is already
+                    # renamed, so a failed update is reported, not raised.
+                    def update_formula(update: Tuple[str, int, str, str]) -> Optional[Exception]:
+                        _, ref_column_id, _, new_formula = update
+                        update_col = smartsheet.models.Column({
+                            'formula': new_formula
+                        })
+                        try:
+                            self.client.Sheets.update_column(sheet_id, ref_column_id, update_col)
+                        except Exception as e:
+                            return e
+                        return None
+
+                    try:
+                        if len(reference_updates) == 1:
+                            errors = [update_formula(reference_updates[0])]
+                        else:
+                            workers = min(UPDATE_CONCURRENCY, len(reference_updates))
+                            with ThreadPoolExecutor(max_workers=workers) as executor:
+                                errors = list(executor.map(update_formula, reference_updates))
+                    finally:
+                        self.invalidate_sheet_info(sheet_id)
+
+                    for (col_name, _, formula, new_formula), error in zip(reference_updates, errors):
+                        reference = {
+                            'column': col_name,
+                            'old_formula': formula,
+                            'new_formula': new_formula,
+                            'status': 'updated' if error is None else 'failed'
+                        }
+                        if error is not None:
+                            logger.warning(f"Failed to update formula in column {col_name}: {str(error)}")
+                            reference['error'] = str(error)
+                        updated_references.append(reference)
 
             result = {
                 "message": "Successfully renamed column",
@@ -1132,53 +2331,96 @@ class SmartsheetOperations:
         Returns:
             bool indicating if condition is met
         """
+        return self._condition_evaluator(condition, cell_type)(cell_value)
+
+    def _condition_evaluator(
+        self,
+        condition: Dict[str, Any],
+        cell_type: str
+    ) -> Callable[[Any], bool]:
+        """
+        Build a predicate for one condition, converting its expected value once.
+
+        The predicate never raises; any error during evaluation means the
+        condition fails. Cases that can't match are settled here, so text
+        comparisons need no per-cell exception handling.
+        """
+        operator_name = condition.get('operator')
+        
+        # Handle empty checks first
+        if operator_name == 'isEmpty':
+            def is_empty(cell_value: Any) -> bool:
+                try:
+                    return cell_value is None or str(cell_value).strip() == ''
+                except Exception:
+                    return False
+            return is_empty
+        if operator_name == 'isNotEmpty':
+            def is_not_empty(cell_value: Any) -> bool:
+                try:
+                    return cell_value is not None and str(cell_value).strip() != ''
+                except Exception:
+                    return False
+            return is_not_empty
+        
+        compare = CONDITION_OPERATORS.get(operator_name)
+        if compare is None:
+            return lambda cell_value: False
+        
+        # Convert the expected value for comparison based on type
+        expected_value = condition.get('value')
         try:
-            operator = condition['operator']
-            expected_value = condition.get('value')
-            
-            # Handle empty checks first
-            if operator == 'isEmpty':
-                return cell_value is None or str(cell_value).strip() == ''
-            if operator == 'isNotEmpty':
-                return cell_value is not None and str(cell_value).strip() != ''
-            
-            # If cell is empty and we're not checking for emptiness, condition fails
-            if cell_value is None:
-                return False
-                
-            # Convert values for comparison based on type
             if cell_type == 'DATE':
-                from datetime import datetime
-                if isinstance(cell_value, str):
-                    cell_value = datetime.fromisoformat(cell_value.replace('Z', '+00:00'))
                 if isinstance(expected_value, str):
-                    expected_value = datetime.fromisoformat(expected_value.replace('Z', '+00:00'))
-            elif cell_type in ['TEXT_NUMBER', 'PICKLIST']:
-                cell_value = str(cell_value)
+                    expected_value = parse_iso_datetime(expected_value)
+            elif cell_type in ('TEXT_NUMBER', 'PICKLIST'):
                 if expected_value is not None:
                     expected_value = str(expected_value)
-            
-            # Perform comparison based on operator
-            if operator == 'equals':
-                return cell_value == expected_value
-            elif operator == 'contains':
-                return expected_value in str(cell_value)
-            elif operator == 'greaterThan':
-                return cell_value > expected_value
-            elif operator == 'lessThan':
-                return cell_value < expected_value
-            
-            return False
-            
         except Exception:
-            # If any error occurs during evaluation, condition fails
-            return False
+            return lambda cell_value: False
+        
+        # Pick the cell conversion once rather than branching on the type
+        # for every cell. If cell is empty and we're not checking for
+        # emptiness, condition fails; so does any error during evaluation.
+        if cell_type == 'DATE':
+            def evaluate_date(cell_value: Any) -> bool:
+                if cell_value is None:
+                    return False
+                try:
+                    if isinstance(cell_value, str):
+                        cell_value = parse_iso_datetime(cell_value)
+                    return compare(cell_value, expected_value)
+                except Exception:
+                    return False
+            return evaluate_date
+        
+        if cell_type in ('TEXT_NUMBER', 'PICKLIST'):
+            # No text matches a missing expected value. Otherwise both sides
+            # are str and the comparison can't fail, so no handler is needed.
+            if expected_value is None:
+                return lambda cell_value: False
+            
+            def evaluate_text(cell_value: Any) -> bool:
+                return cell_value is not None and compare(str(cell_value), expected_value)
+            return evaluate_text
+        
+        def evaluate(cell_value: Any) -> bool:
+            if cell_value is None:
+                return False
+            try:
+                return compare(cell_value, expected_value)
+            except Exception:
+                return False
+        
+        return evaluate
 
     def _evaluate_conditions(
         self,
         conditions: List[Dict[str, Any]],
         row: Any,
-        column_info: Dict[str, Any]
+        column_info: Dict[str, Any],
+        col_type_by_id: Optional[Dict[str, str]] = None,
+        cell_by_col: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Evaluate all conditions for a row (AND logic).
@@ -1187,34 +2429,213 @@ class SmartsheetOperations:
             conditions: List of conditions to evaluate
             row: Row data to check
             column_info: Column metadata for type information
+            col_type_by_id: Column type per str(column id), from
+                _column_types_by_id; built from column_info when omitted
+            cell_by_col: The row's cells per str(column id), from
+                _cells_by_column; built from row when omitted
             
         Returns:
             bool indicating if all conditions are met
         """
+        if col_type_by_id is None:
+            col_type_by_id = self._column_types_by_id(column_info)
+        if cell_by_col is None:
+            cell_by_col = self._cells_by_column(row)
+        
         for condition in conditions:
-            column_id = condition['columnId']
+            column_id = str(condition['columnId'])
             # Find the cell with matching column ID
-            matching_cell = None
-            cell_type = 'TEXT_NUMBER'  # default type
-            
-            for cell in row.cells:
-                if str(cell.column_id) == str(column_id):
-                    matching_cell = cell
-                    # Find column type from column_info
-                    for col_name, info in column_info.items():
-                        if info['id'] == str(column_id):
-                            cell_type = info.get('type', 'TEXT_NUMBER')
-                            break
-                    break
-            
+            matching_cell = cell_by_col.get(column_id)
             if not matching_cell:
                 return False
+            cell_type = col_type_by_id.get(column_id, 'TEXT_NUMBER')
                 
             if not self._evaluate_condition(condition, matching_cell.value, cell_type):
                 return False
         
         return True
 
+    def _compile_conditions(
+        self,
+        conditions: List[Dict[str, Any]],
+        col_type_by_id: Dict[str, str]
+    ) -> List[Tuple[str, Callable[[Any], bool], Optional[Callable[[List[bool], List[Any]], List[bool]]]]]:
+        """
+        Prepare a rule's conditions once for every row of a bulk update.
+
+        Returns:
+            List of (str(column id), predicate, batch kernel or None)
+            triples, one per condition
+        """
+        compiled = []
+        for condition in conditions:
+            column_id = str(condition['columnId'])
+            cell_type = col_type_by_id.get(column_id, 'TEXT_NUMBER')
+            compiled.append((
+                column_id,
+                self._condition_evaluator(condition, cell_type),
+                self._condition_kernel(condition, cell_type)
+            ))
+        return compiled
+
+    def _condition_kernel(
+        self,
+        condition: Dict[str, Any],
+        cell_type: str
+    ) -> Optional[Callable[[List[bool], List[Any]], List[bool]]]:
+        """
+        Build a batch kernel for a text comparison, if the condition has one.
+
+        The kernel takes the running mask and a column's values and returns
+        the new mask, comparing inline instead of calling the per-value
+        predicate for every cell. It may raise; the caller then falls back
+        to the predicate, which turns errors into a failed condition.
+
+        Returns:
+            The kernel, or None when only the predicate applies
+        """
+        if cell_type not in ('TEXT_NUMBER', 'PICKLIST'):
+            return None
+        compare = CONDITION_OPERATORS.get(condition.get('operator'))
+        if compare is None:
+            return None
+        expected_value = condition.get('value')
+        if expected_value is None:
+            return None
+        expected_value = str(expected_value)
+
+        def text_kernel(mask: List[bool], values: List[Any]) -> List[bool]:
+            return [
+                matched and value is not _MISSING and value is not None
+                and compare(str(value), expected_value)
+                for matched, value in zip(mask, values)
+            ]
+        return text_kernel
+
+    def _required_value_columns(self, conditions: List[Dict[str, Any]]) -> frozenset:
+        """
+        Get the ids of columns a row must have a non-empty value in to match.
+
+        Every operator except isEmpty fails on a missing or None cell.
+        """
+        return frozenset(
+            str(condition['columnId'])
+            for condition in conditions
+            if condition.get('operator') != 'isEmpty'
+        )
+
+    def _rule_mask(
+        self,
+        compiled_conditions: List[Tuple[str, Callable[[Any], bool], Optional[Callable[[List[bool], List[Any]], List[bool]]]]],
+        batch_cells: List[Dict[str, Any]],
+        required_columns: frozenset = frozenset(),
+        batch_value_columns: Optional[List[frozenset]] = None,
+        batch_columns: Optional[Dict[str, List[Any]]] = None
+    ) -> List[bool]:
+        """
+        Evaluate a rule's conditions (AND logic) over a batch of rows at once.
+
+        Rows missing a value in one of the required columns are rejected
+        before any condition runs, rows that already failed an earlier
+        condition are skipped, and evaluation stops once no row can match.
+        Each condition runs over its column's values as one list, through
+        its batch kernel when it has one.
+
+        Args:
+            compiled_conditions: Conditions from _compile_conditions
+            batch_cells: Each row's cells, as built by _cells_by_column
+            required_columns: Column ids from _required_value_columns
+            batch_value_columns: Each row's ids of columns holding a value
+            batch_columns: Column values already gathered by
+                _batch_column_values, keyed by column id; filled in for
+                columns not there yet, so rules can share it
+
+        Returns:
+            One bool per row indicating if all conditions are met
+        """
+        if required_columns and batch_value_columns is not None:
+            mask = [required_columns <= value_columns for value_columns in batch_value_columns]
+            if not any(mask):
+                return mask
+        else:
+            mask = [True] * len(batch_cells)
+        if batch_columns is None:
+            batch_columns = {}
+        for column_id, evaluate, kernel in compiled_conditions:
+            values = batch_columns.get(column_id)
+            if values is None:
+                values = batch_columns[column_id] = self._batch_column_values(batch_cells, column_id)
+            new_mask = None
+            if kernel is not None:
+                try:
+                    new_mask = kernel(mask, values)
+                except Exception:
+                    new_mask = None
+            if new_mask is None:
+                new_mask = [
+                    matched and value is not _MISSING and evaluate(value)
+                    for matched, value in zip(mask, values)
+                ]
+            mask = new_mask
+            # No row left to match, so later conditions can't change anything
+            if not any(mask):
+                break
+        return mask
+
+    def _batch_column_values(self, batch_cells: List[Dict[str, Any]], column_id: str) -> List[Any]:
+        """Get one column's cell values across a batch, with _MISSING where a row has no cell."""
+        values = []
+        for cells in batch_cells:
+            cell = cells.get(column_id)
+            values.append(_MISSING if cell is None else cell.value)
+        return values
+
+    def _rule_update_cells(self, rule: Dict[str, Any]) -> List[smartsheet.models.Cell]:
+        """Build the cells a bulk_update rule writes to each matching row."""
+        cells = []
+        for update in rule['updates']:
+            cell = smartsheet.models.Cell()
+            cell.column_id = int(update['columnId'])
+            cell.value = update['value']
+            cells.append(cell)
+        return cells
+
+    def _condition_column_ids(
+        self,
+        rules: List[Dict[str, Any]],
+        column_info: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Get the ids of existing columns read by bulk_update rule conditions.
+
+        Returns an empty list (meaning fetch every column) if a rule is
+        malformed, so the error is reported the usual way.
+        """
+        known_ids = {info['id'] for info in column_info.values()}
+        try:
+            referenced = {
+                str(condition['columnId'])
+                for rule in rules
+                for condition in rule['conditions']
+            }
+        except (KeyError, TypeError):
+            return []
+        return sorted(referenced & known_ids)
+
+    def _column_types_by_id(self, column_info: Dict[str, Any]) -> Dict[str, str]:
+        """Map str(column id) to column type, for condition evaluation."""
+        col_type_by_id: Dict[str, str] = {}
+        for info in column_info.values():
+            col_type_by_id.setdefault(info['id'], info.get('type', 'TEXT_NUMBER'))
+        return col_type_by_id
+
+    def _cells_by_column(self, row: Any) -> Dict[str, Any]:
+        """Map str(column id) to the row's cell in that column."""
+        cell_by_col: Dict[str, Any] = {}
+        for cell in row.cells:
+            cell_by_col.setdefault(str(cell.column_id), cell)
+        return cell_by_col
+
     def bulk_update(
         self,
         sheet_id: str,
@@ -1230,20 +2651,25 @@ class SmartsheetOperations:
             options: Update options including:
                 - lenientMode: Allow partial success
                 - batchSize: Number of rows per batch (default 500)
+                - concurrency: Batch update requests sent in parallel
+                  (default UPDATE_CONCURRENCY)
+                - maxFailuresRetained: Keep only this many of the most
+                  recent failures in the result (default None, keep all).
+                  When set, the result's failuresTruncated says whether any
+                  were dropped; failureCount always counts all of them.
+                - onFailure: Callable given each failure record as it happens
+                
+        Each page of rows becomes one update batch, sent as soon as it is
+        prepared. Without lenientMode the first failure stops further
+        batches from being sent, and the error names the batches (numbered
+        from 0 in send order) that were already applied.
                 
         Returns:
             Dict containing operation results
         """
         try:
-            # Get sheet info for column validation
-            sheet_info = self.get_sheet_info(sheet_id)
-            column_info = sheet_info.get('column_info', {})
-            
-            # Get the sheet with all rows
-            sheet = self.client.Sheets.get_sheet(sheet_id)
-            
             # Initialize result tracking
-            result = {
+            result: Dict[str, Any] = {
                 'totalAttempted': 0,
                 'successCount': 0,
                 'failureCount': 0,
@@ -1253,60 +2679,218 @@ class SmartsheetOperations:
             # Process in batches
             batch_size = options.get('batchSize', 500)
             lenient_mode = options.get('lenientMode', False)
+            concurrency = max(1, options.get('concurrency', UPDATE_CONCURRENCY))
+            
+            # Callers can bound memory on sheets with many failures
+            max_failures = options.get('maxFailuresRetained')
+            failures: "deque[Dict[str, Any]]" = deque(maxlen=max_failures)
+            on_failure = options.get('onFailure')
+            
+            def record_failure(failure: Dict[str, Any]) -> None:
+                result['failureCount'] += 1
+                failures.append(failure)
+                if on_failure is not None:
+                    on_failure(failure)
+            if batch_size < 1:
+                raise ValueError("batchSize must be at least 1")
+            
+            # Column details for condition types (cached, and only columns plus
+            # a few sample rows). Rows are then fetched with just the columns
+            # the conditions read.
+            sheet_info = self._sheet_info(sheet_id)
+            page_options = {}
+            if 'error' not in sheet_info:
+                condition_column_ids = self._condition_column_ids(
+                    rules,
+                    sheet_info.get('column_info', {})
+                )
+                if condition_column_ids:
+                    page_options['column_ids'] = ','.join(condition_column_ids)
+            
+            # Send each page's batch as soon as it is prepared, with at most
+            # one batch per worker in flight, so only about `concurrency`
+            # pages of updates are held in memory
+            in_flight: "deque[Tuple[int, List[Any], Future]]" = deque()
+            applied_batches: List[int] = []
+            batch_count = 0
+            failed_batch = None
+            
+            def collect_oldest() -> None:
+                """Wait for the oldest batch in flight and record its outcome."""
+                nonlocal failed_batch
+                batch_number, updates_batch, future = in_flight.popleft()
+                try:
+                    future.result()
+                except Exception as e:
+                    for row in updates_batch:
+                        record_failure({
+                            'rowId': str(row.id_),
+                            'error': str(e),
+                            'rollbackStatus': 'failed'
+                        })
+                    if failed_batch is None:
+                        failed_batch = (batch_number, e)
+                else:
+                    result['successCount'] += len(updates_batch)
+                    applied_batches.append(batch_number)
             
-            for i in range(0, len(sheet.rows), batch_size):
-                batch_rows = sheet.rows[i:i + batch_size]
-                updates_batch = []
-                
-                # Find rows that match conditions and prepare updates
-                for row in batch_rows:
-                    result['totalAttempted'] += 1
-                    row_updates = []
+            error = None
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            try:
+                compiled_rules = None
+                for page in self._iter_sheet_pages(sheet_id, page_size=batch_size, **page_options):
+                    if compiled_rules is None:
+                        # Without sheet info, derive column details from the
+                        # first page's columns instead
+                        if 'error' in sheet_info:
+                            sheet_info = self._build_sheet_info(sheet_id, page)
+                        column_info = sheet_info.get('column_info', {})
+                        col_type_by_id = self._column_types_by_id(column_info)
                     
-                    try:
-                        # Check each rule
+                        # Stringify column ids and convert expected values once for
+                        # all batches; an error here is reported against each row below
+                        compiled_rules = []
+                        rules_required_columns = []
+                        rules_error = None
+                        try:
+                            compiled_rules = [
+                                self._compile_conditions(rule['conditions'], col_type_by_id)
+                                for rule in rules
+                            ]
+                            rules_required_columns = [
+                                self._required_value_columns(rule['conditions'])
+                                for rule in rules
+                            ]
+                        except Exception as e:
+                            rules_error = e
+                    
+                        # Each rule writes the same cells to every row it matches,
+                        # so build them once and share them between rows. A bad
+                        # update is kept and reported for each matching row.
+                        rule_cells: List[Union[List[Any], Exception]] = []
                         for rule in rules:
-                            if self._evaluate_conditions(rule['conditions'], row, column_info):
-                                # All conditions met, add updates
-                                for update in rule['updates']:
-                                    cell = smartsheet.models.Cell()
-                                    cell.column_id = int(update['columnId'])
-                                    cell.value = update['value']
-                                    row_updates.append(cell)
-                        
-                        if row_updates:
-                            # Create row object for update
-                            new_row = smartsheet.models.Row()
-                            new_row.id_ = row.id_
-                            new_row.cells = row_updates
-                            updates_batch.append(new_row)
-                            
-                    except Exception as e:
-                        result['failureCount'] += 1
-                        result['failures'].append({
-                            'rowId': str(row.id),
-                            'error': str(e),
-                            'rollbackStatus': 'not_attempted'
-                        })
-                        if not lenient_mode:
-                            raise
+                            try:
+                                rule_cells.append(self._rule_update_cells(rule))
+                            except Exception as e:
+                                rule_cells.append(e)
+                
+                    batch_rows = page.rows
+                    updates_batch = []
                 
-                # Perform batch update if we have any updates
-                if updates_batch:
+                    # Evaluate every rule over the whole batch up front; an error
+                    # here is reported against each row below
+                    rule_masks = []
+                    any_rule_mask = []
+                    mask_error = None
                     try:
-                        self.client.Sheets.update_rows(sheet_id, updates_batch)
-                        result['successCount'] += len(updates_batch)
+                        if rules_error is not None:
+                            raise rules_error
+                        batch_cells = [self._cells_by_column(row) for row in batch_rows]
+                        # Sparse rows usually lack values in the condition columns
+                        # and can be rejected with a set check per rule
+                        batch_value_columns = [
+                            frozenset(
+                                column_id for column_id, cell in cells.items()
+                                if cell.value is not None
+                            )
+                            for cells in batch_cells
+                        ]
+                        # Each condition column's values, gathered once for all rules
+                        batch_columns: Dict[str, Any] = {}
+                        rule_masks = [
+                            self._rule_mask(
+                                compiled_conditions,
+                                batch_cells,
+                                required_columns,
+                                batch_value_columns,
+                                batch_columns
+                            )
+                            for compiled_conditions, required_columns
+                            in zip(compiled_rules, rules_required_columns)
+                        ]
+                        # Merge the masks once so rows no rule matches skip the
+                        # per-rule checks below
+                        if rule_masks:
+                            any_rule_mask = [any(matches) for matches in zip(*rule_masks)]
+                        else:
+                            any_rule_mask = [False] * len(batch_rows)
                     except Exception as e:
-                        result['failureCount'] += len(updates_batch)
-                        for row in updates_batch:
-                            result['failures'].append({
-                                'rowId': str(row.id_),
+                        mask_error = e
+                
+                    # Find rows that match conditions and prepare updates
+                    for row_index, row in enumerate(batch_rows):
+                        result['totalAttempted'] += 1
+                        if mask_error is None and not any_rule_mask[row_index]:
+                            continue
+                        row_updates = []
+                    
+                        try:
+                            if mask_error is not None:
+                                raise mask_error
+                        
+                            # Check each rule
+                            for cells, mask in zip(rule_cells, rule_masks):
+                                if mask[row_index]:
+                                    # All conditions met, add updates
+                                    if isinstance(cells, Exception):
+                                        raise cells
+                                    row_updates.extend(cells)
+                        
+                            if row_updates:
+                                # Create row object for update
+                                new_row = smartsheet.models.Row()
+                                new_row.id_ = row.id_
+                                new_row.cells = row_updates
+                                updates_batch.append(new_row)
+                            
+                        except Exception as e:
+                            record_failure({
+                                'rowId': str(row.id),
                                 'error': str(e),
-                                'rollbackStatus': 'failed'
+                                'rollbackStatus': 'not_attempted'
                             })
-                        if not lenient_mode:
-                            raise
-            
+                            if not lenient_mode:
+                                raise
+                
+                    # Send the batch, then wait for the oldest one once
+                    # every worker is busy
+                    if updates_batch:
+                        in_flight.append((
+                            batch_count,
+                            updates_batch,
+                            executor.submit(self.client.Sheets.update_rows, sheet_id, updates_batch)
+                        ))
+                        batch_count += 1
+                        while len(in_flight) >= concurrency:
+                            collect_oldest()
+                        if failed_batch is not None and not lenient_mode:
+                            # Stop queueing new batches
+                            break
+            except Exception as e:
+                error = e
+            finally:
+                # Batches already sent complete either way
+                while in_flight:
+                    collect_oldest()
+                executor.shutdown()
+                if batch_count:
+                    self.invalidate_sheet_info(sheet_id, schema=False)
+            
+            if error is None and failed_batch is not None and not lenient_mode:
+                batch_number, batch_error = failed_batch
+                error = RuntimeError(f"Batch {batch_number} failed: {str(batch_error)}")
+            if error is not None:
+                # Say which batches were written before stopping
+                if applied_batches:
+                    raise RuntimeError(
+                        f"{str(error)}; {result['successCount']} rows in batches "
+                        f"{applied_batches} were already updated"
+                    ) from error
+                raise error
+            
+            result['failures'] = list(failures)
+            if max_failures is not None:
+                result['failuresTruncated'] = result['failureCount'] > len(failures)
             return result
             
         except Exception as e:
@@ -1328,11 +2912,45 @@ class SmartsheetOperations:
             Tuple of (valid_ids: List[str], errors: List[Dict[str, str]])
         """
         try:
-            # Get the sheet with row IDs
-            sheet = self.client.Sheets.get_sheet(sheet_id)
-            
-            # Create set of existing row IDs
-            existing_ids = {str(row.id_) for row in sheet.rows}
+            wanted_ids = set(row_ids)
+            if len(wanted_ids) < ROW_LOOKUP_THRESHOLD:
+                existing_ids = self._existing_row_ids_by_lookup(sheet_id, wanted_ids)
+            else:
+                # Only row IDs are needed, so fetch a single column's cells
+                page_options = {}
+                column_map = self._sheet_info(sheet_id).get('column_map')
+                if column_map:
+                    page_options['column_ids'] = next(iter(column_map.values()))
+                
+                # Compare as ints, the SDK's row ID type, so fetched rows need
+                # no conversion; IDs that aren't canonical ints can't exist
+                wanted_by_number = {
+                    int(row_id): row_id for row_id in wanted_ids
+                    if isinstance(row_id, str) and row_id.isdigit() and str(int(row_id)) == row_id
+                }
+                wanted_numbers = wanted_by_number.keys()
+                
+                # Ask for just the requested rows, a chunk of IDs per request
+                found_numbers = set()
+                numbers = list(wanted_numbers)
+                try:
+                    for start in range(0, len(numbers), ROW_ID_FILTER_SIZE):
+                        sheet = self.client.Sheets.get_sheet(
+                            sheet_id,
+                            row_ids=numbers[start:start + ROW_ID_FILTER_SIZE],
+                            **page_options
+                        )
+                        found_numbers.update(wanted_numbers & set(map(ROW_ID, sheet.rows or ())))
+                except Exception as e:
+                    # Fall back to paging through the sheet, stopping once
+                    # every requested ID has been seen
+                    logger.warning(f"Row ID filter failed, paging through sheet {sheet_id}: {str(e)}")
+                    found_numbers = set()
+                    for page in self._iter_sheet_pages(sheet_id, **page_options):
+                        found_numbers.update(wanted_numbers & set(map(ROW_ID, page.rows)))
+                        if len(found_numbers) == len(wanted_by_number):
+                            break
+                existing_ids = {wanted_by_number[number] for number in found_numbers}
             
             valid_ids = []
             errors = []
@@ -1351,8 +2969,63 @@ class SmartsheetOperations:
         except Exception as e:
             raise RuntimeError(f"Failed to validate row IDs: {str(e)}")
             
+    def _existing_row_ids_by_lookup(self, sheet_id: str, row_ids: Set[str]) -> Set[str]:
+        """
+        Check which row IDs exist with concurrent get_row requests.
+
+        A not-found API error means the row doesn't exist; other errors
+        propagate.
+        """
+        def row_exists(row_id: str) -> bool:
+            try:
+                self.client.Sheets.get_row(sheet_id, int(row_id))
+                return True
+            except ValueError:
+                # Not a numeric row ID
+                return False
+            except smartsheet.exceptions.ApiError as e:
+                result = getattr(getattr(e, 'error', None), 'result', None)
+                if getattr(result, 'error_code', None) == API_ERROR_NOT_FOUND:
+                    return False
+                raise
+        
+        if not row_ids:
+            return set()
+        ordered_ids = list(row_ids)
+        with ThreadPoolExecutor(max_workers=min(UPDATE_CONCURRENCY, len(ordered_ids))) as executor:
+            found = executor.map(row_exists, ordered_ids)
+            return {row_id for row_id, exists in zip(ordered_ids, found) if exists}
+
     # Workspace Operations
     
+    def _item_summary(
+        self,
+        item: Any,
+        include_permalink: bool = False,
+        optional_fields: Tuple[str, ...] = ()
+    ) -> Dict[str, Any]:
+        """
+        Summarize a workspace, sheet, folder, report or sight as JSON-safe strings.
+
+        Args:
+            item: SDK object with id and name
+            include_permalink: Add "permalink" (None when the item has none)
+            optional_fields: Further attributes to add as strings, only when
+                present and not None
+        """
+        summary: Dict[str, Any] = {
+            "id": str(item.id),
+            "name": str(item.name)
+        }
+        if include_permalink:
+            permalink = getattr(item, 'permalink', _MISSING)
+            summary["permalink"] = None if permalink is _MISSING else str(permalink)
+        for field in optional_fields:
+            value = getattr(item, field, None)
+            if value is not None:
+                summary[field] = str(value)
+        return summary
+
     def list_workspaces(self) -> Dict[str, Any]:
         """
         List all accessible workspaces.
@@ -1369,11 +3042,7 @@ class SmartsheetOperations:
             
             for workspace in response.data:
                 # Convert all values to their string representation to ensure JSON serialization
-                workspace_data = {
-                    "id": str(workspace.id),
-                    "name": str(workspace.name),
-                    "permalink": str(workspace.permalink) if hasattr(workspace, 'permalink') else None
-                }
+                workspace_data = self._item_summary(workspace, include_permalink=True)
                 
                 # Handle access_level which might be an EnumeratedValue
                 if hasattr(workspace, 'access_level'):
@@ -1407,55 +3076,31 @@ class SmartsheetOperations:
             if isinstance(workspace_id, str):
                 workspace_id = int(workspace_id)
                 
-            workspace = self.client.Workspaces.get_workspace(workspace_id)
+            workspace = self._get_workspace_cached(workspace_id)
             
             # Process sheets
-            sheets = []
-            if hasattr(workspace, 'sheets') and workspace.sheets:
-                for sheet in workspace.sheets:
-                    sheets.append({
-                        "id": str(sheet.id),
-                        "name": str(sheet.name),
-                        "permalink": str(sheet.permalink) if hasattr(sheet, 'permalink') else None
-                    })
+            sheets = [
+                self._item_summary(sheet, include_permalink=True)
+                for sheet in getattr(workspace, 'sheets', None) or []
+            ]
             
             # Process folders
-            folders = []
-            if hasattr(workspace, 'folders') and workspace.folders:
-                for folder in workspace.folders:
-                    folders.append({
-                        "id": str(folder.id),
-                        "name": str(folder.name)
-                    })
+            folders = [self._item_summary(folder) for folder in getattr(workspace, 'folders', None) or []]
             
             # Process reports
-            reports = []
-            if hasattr(workspace, 'reports') and workspace.reports:
-                for report in workspace.reports:
-                    reports.append({
-                        "id": str(report.id),
-                        "name": str(report.name)
-                    })
+            reports = [self._item_summary(report) for report in getattr(workspace, 'reports', None) or []]
             
             # Process sights (dashboards)
-            sights = []
-            if hasattr(workspace, 'sights') and workspace.sights:
-                for sight in workspace.sights:
-                    sights.append({
-                        "id": str(sight.id),
-                        "name": str(sight.name)
-                    })
+            sights = [self._item_summary(sight) for sight in getattr(workspace, 'sights', None) or []]
             
             # Convert all values to strings to ensure JSON serialization
-            result = {
-                "id": str(workspace.id),
-                "name": str(workspace.name),
-                "permalink": str(workspace.permalink) if hasattr(workspace, 'permalink') else None,
+            result = self._item_summary(workspace, include_permalink=True)
+            result.update({
                 "sheets": sheets,
                 "folders": folders,
                 "reports": reports,
                 "sights": sights
-            }
+            })
             
             # Handle access_level which might be an EnumeratedValue
             if hasattr(workspace, 'access_level'):
@@ -1558,6 +3203,7 @@ class SmartsheetOperations:
             
             # Create the sheet in the workspace
             response = self.client.Workspaces.create_sheet_in_workspace(workspace_id, sheet)
+            self.invalidate_workspace(workspace_id)
             
             return {
                 "success": True,
@@ -1589,25 +3235,17 @@ class SmartsheetOperations:
                 workspace_id = int(workspace_id)
                 
             # Get the workspace
-            workspace = self.client.Workspaces.get_workspace(workspace_id)
+            workspace = self._get_workspace_cached(workspace_id)
             
             sheets = []
             if hasattr(workspace, 'sheets') and workspace.sheets:
                 for sheet in workspace.sheets:
-                    sheet_data = {
-                        "id": str(sheet.id),
-                        "name": str(sheet.name),
-                        "permalink": str(sheet.permalink) if hasattr(sheet, 'permalink') else None
-                    }
-                    
-                    # Handle created_at and modified_at which might be special types
-                    if hasattr(sheet, 'created_at') and sheet.created_at is not None:
-                        sheet_data["created_at"] = str(sheet.created_at)
-                    
-                    if hasattr(sheet, 'modified_at') and sheet.modified_at is not None:
-                        sheet_data["modified_at"] = str(sheet.modified_at)
-                        
-                    sheets.append(sheet_data)
+                    # created_at and modified_at might be special types
+                    sheets.append(self._item_summary(
+                        sheet,
+                        include_permalink=True,
+                        optional_fields=('created_at', 'modified_at')
+                    ))
             
             return {
                 "workspace_id": str(workspace_id),
@@ -2283,7 +3921,7 @@ class SmartsheetOperations:
         try:
             # First get sheet info to get all columns if none specified
             if not column_ids:
-                sheet_info = self.get_sheet_info(sheet_id)
+                sheet_info = self._sheet_info(sheet_id)
                 if 'error' in sheet_info:
                     return {"error": f"Failed to get sheet info: {sheet_info['error']}"}
                 
@@ -2704,6 +4342,7 @@ class SmartsheetOperations:
             
             # Update the rows with formulas
             result = self.client.Sheets.update_rows(sheet_id, rows_to_update)
+            self.invalidate_sheet_info(sheet_id, schema=False)
             
             if result and result.result:
                 updated_rows = result.result
@@ -2721,3 +4360,30 @@ class SmartsheetOperations:
                 
         except Exception as e:
             return {"error": f"Failed to create cross-reference: {str(e)}"}
+
+
+class SheetContext:
+    """Sheet details fetched once and shared by several row operations."""
+
+    def __init__(self, ops: SmartsheetOperations, sheet_id: str, sheet_info: Dict[str, Any]):
+        self.ops = ops
+        self.sheet_id = sheet_id
+        self.sheet_info = sheet_info
+        self.column_map = sheet_info.get('column_map', {})
+        self.column_info = sheet_info.get('column_info', {})
+        picklist_options = sheet_info.get('picklist_options')
+        if picklist_options is None:
+            picklist_options = ops._picklist_options(self.column_info)
+        self.picklist_options: Dict[str, frozenset] = picklist_options
+        system_managed_fields = sheet_info.get('system_managed_fields')
+        if system_managed_fields is None:
+            system_managed_fields = ops._system_managed_fields(self.column_info)
+        self.system_managed_fields: frozenset = system_managed_fields
+
+    def add_rows(self, row_data: List[Dict[str, Any]], column_map: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Add rows to the sheet, defaulting to its own column map."""
+        return self.ops._add_rows_impl(self, row_data, column_map or self.column_map)
+
+    def update_rows(self, updates: List[Dict[str, Any]], column_map: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Update rows in the sheet, defaulting to its own column map."""
+        return self.ops._update_rows_impl(self, updates, column_map or self.column_map)
@@ -0,0 +1,5 @@
+"""Allow running the CLI with ``python -m smartsheet_ops``."""
+from .cli import run
+
+if __name__ == '__main__':
+    run()
@@ -190,12 +190,9 @@ class BatchProcessor:
         
         # Initialize tiktoken encoder
         self.encoder = tiktoken.get_encoding("cl100k_base")
-        # Initialize Azure OpenAI client for prompt optimization
-        self.prompt_optimizer = AzureOpenAI(
-            azure_endpoint=os.getenv("AZURE_OPENAI_API_BASE"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION")
-        )
+        # Prompt optimization uses the same settings as the module-level
+        # client, so share it rather than building another
+        self.prompt_optimizer = client
         
         # Template definitions with system prompts
         self.templates = {
@@ -6,7 +6,8 @@ import asyncio
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from . import SmartsheetOperations
+# orjson is None unless installed (pip install smartsheet_ops[json])
+from . import SmartsheetOperations, __version__, orjson
 from .batch_analysis import processor, AnalysisType
 
 # Load environment variables from root .env file
@@ -15,6 +16,7 @@ load_dotenv(env_path, override=True)
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Smartsheet Operations CLI')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
     parser.add_argument('--api-key', required=True, help='Smartsheet API key')
     parser.add_argument('--operation', required=True, 
                        choices=['get_column_map', 'add_rows', 'add_hierarchical_rows', 'check_duplicate', 'update_rows', 'delete_rows', 'search', 'get_all_row_ids',
@@ -32,6 +34,14 @@ def parse_args():
     parser.add_argument('--data', help='JSON data for operations')
     return parser.parse_args()
 
+def print_json(obj, file=None):
+    """Print obj as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    else:
+        text = json.dumps(obj, indent=2)
+    print(text, file=file)
+
 def check_for_duplicate(ops, sheet_id, new_row_data):
     """Check if a record with the same data exists"""
     # Get the sheet info to get current data
@@ -67,17 +77,17 @@ async def main():
         # Perform requested operation
         if args.operation == 'get_column_map':
             result = ops.get_sheet_info(args.sheet_id)
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'check_duplicate':
             if not args.data:
                 raise ValueError("--data is required for check_duplicate operation")
             data = json.loads(args.data)
             is_duplicate = check_for_duplicate(ops, args.sheet_id, data)
-            print(json.dumps({
+            print_json({
                 "duplicate": is_duplicate,
                 "operation": "check_duplicate"
-            }, indent=2))
+            })
             
         elif args.operation == 'add_rows':
             if not args.data:
@@ -89,10 +99,10 @@ async def main():
             # Check for duplicates before adding
             for row in data['row_data']:
                 if check_for_duplicate(ops, args.sheet_id, row):
-                    print(json.dumps({
+                    print_json({
                         "message": "Duplicate record found - skipping addition",
                         "operation": "add_rows"
-                    }, indent=2))
+                    })
                     return
                     
             result = ops.add_rows(args.sheet_id, data['row_data'], data['column_map'])
@@ -101,7 +111,7 @@ async def main():
             # Find our newly added rows (they'll be at the top since we use to_top=True)
             new_row_ids = [str(row.id) for row in sheet.rows[:len(data['row_data'])]]
             result['row_ids'] = new_row_ids
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'add_hierarchical_rows':
             if not args.data:
@@ -111,7 +121,7 @@ async def main():
                 raise ValueError("Invalid data format. Expected: {'hierarchical_data': [...], 'column_map': {...}}")
             
             result = ops.add_hierarchical_rows(args.sheet_id, data['hierarchical_data'], data['column_map'])
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'update_rows':
             if not args.data:
@@ -121,17 +131,17 @@ async def main():
                 raise ValueError("Invalid data format. Expected: {'updates': [...], 'column_map': {...}}")
             
             result = ops.update_rows(args.sheet_id, data['updates'], data['column_map'])
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'delete_rows':
             if not args.data:
                 raise ValueError("--data is required for delete_rows operation")
             data = json.loads(args.data)
             if not isinstance(data, dict) or 'row_ids' not in data:
-                raise ValueError("Invalid data format. Expected: {'row_ids': [...]}")
+                raise ValueError("Invalid data format. Expected: {'row_ids': [...], 'validate': bool}")
             
-            result = ops.delete_rows(args.sheet_id, data['row_ids'])
-            print(json.dumps(result, indent=2))
+            result = ops.delete_rows(args.sheet_id, data['row_ids'], data.get('validate', True))
+            print_json(result)
             
         elif args.operation == 'search':
             if not args.data:
@@ -145,7 +155,7 @@ async def main():
                 data['pattern'],
                 data.get('options')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'add_column':
             if not args.data:
@@ -155,7 +165,7 @@ async def main():
                 raise ValueError("Invalid data format. Expected: {'title': str, 'type': str, ...}")
             
             result = ops.add_column(args.sheet_id, data)
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'delete_column':
             if not args.data:
@@ -169,7 +179,7 @@ async def main():
                 data['column_id'],
                 data.get('validate_dependencies', True)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'rename_column':
             if not args.data:
@@ -184,7 +194,7 @@ async def main():
                 data['new_title'],
                 data.get('update_references', True)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'bulk_update':
             if not args.data:
@@ -198,7 +208,7 @@ async def main():
                 data['rules'],
                 data.get('options', {})
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_all_row_ids':
             # Fetch all row IDs from the specified sheet
@@ -208,7 +218,7 @@ async def main():
                 "operation": "get_all_row_ids",
                 "row_ids": row_ids
             }
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'start_analysis':
             if not args.data:
@@ -226,7 +236,7 @@ async def main():
                 ops.client,
                 data.get('customGoal')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'cancel_analysis':
             if not args.data:
@@ -236,7 +246,7 @@ async def main():
                 raise ValueError("Invalid data format. Expected: {'jobId': str}")
             
             result = processor.cancel_analysis(data['jobId'])
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_job_status':
             if not args.data:
@@ -246,17 +256,17 @@ async def main():
                 raise ValueError("Invalid data format. Expected: {'jobId': str}")
             
             result = processor.get_job_status(data['jobId'], args.sheet_id)
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'list_workspaces':
             result = ops.list_workspaces()
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_workspace':
             if not args.workspace_id:
                 raise ValueError("--workspace-id is required for get_workspace operation")
             result = ops.get_workspace(args.workspace_id)
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'create_workspace':
             if not args.data:
@@ -265,7 +275,7 @@ async def main():
             if not isinstance(data, dict) or 'name' not in data:
                 raise ValueError("Invalid data format. Expected: {'name': str}")
             result = ops.create_workspace(data['name'])
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'create_sheet_in_workspace':
             if not args.workspace_id:
@@ -276,13 +286,13 @@ async def main():
             if not isinstance(data, dict) or 'name' not in data or 'columns' not in data:
                 raise ValueError("Invalid data format. Expected: {'name': str, 'columns': [...]}")
             result = ops.create_sheet_in_workspace(args.workspace_id, data)
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'list_workspace_sheets':
             if not args.workspace_id:
                 raise ValueError("--workspace-id is required for list_workspace_sheets operation")
             result = ops.list_workspace_sheets(args.workspace_id)
-            print(json.dumps(result, indent=2))
+            print_json(result)
         
         # Attachment operations
         elif args.operation == 'upload_attachment':
@@ -296,7 +306,7 @@ async def main():
                 data.get('target_id'),
                 data.get('file_name')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_attachments':
             if not args.data:
@@ -307,7 +317,7 @@ async def main():
                 data.get('attachment_type'),
                 data.get('target_id')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'download_attachment':
             if not args.data:
@@ -318,7 +328,7 @@ async def main():
                 data.get('attachment_id'),
                 data.get('save_path')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'delete_attachment':
             if not args.data:
@@ -328,7 +338,7 @@ async def main():
                 args.sheet_id,
                 data.get('attachment_id')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
         
         # Discussion operations
         elif args.operation == 'create_discussion':
@@ -342,7 +352,7 @@ async def main():
                 data.get('target_id'),
                 data.get('title')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'add_comment':
             if not args.data:
@@ -353,7 +363,7 @@ async def main():
                 data.get('discussion_id'),
                 data.get('comment_text')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_discussions':
             if not args.data:
@@ -365,7 +375,7 @@ async def main():
                 data.get('target_id'),
                 data.get('include_comments', False)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_comments':
             if not args.data:
@@ -376,7 +386,7 @@ async def main():
                 data.get('discussion_id'),
                 data.get('include_attachments', True)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'delete_comment':
             if not args.data:
@@ -386,7 +396,7 @@ async def main():
                 args.sheet_id,
                 data.get('comment_id')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
         
         # Cell history operations
         elif args.operation == 'get_cell_history':
@@ -399,7 +409,7 @@ async def main():
                 data.get('column_id'),
                 data.get('include_all', True)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'get_row_history':
             if not args.data:
@@ -411,7 +421,7 @@ async def main():
                 data.get('include_all', True),
                 data.get('column_ids')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
         
         # Cross-sheet reference operations
         elif args.operation == 'get_sheet_cross_references':
@@ -422,7 +432,7 @@ async def main():
                 args.sheet_id,
                 data.get('include_details', True)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'find_sheet_references':
             if not args.data:
@@ -432,7 +442,7 @@ async def main():
                 data.get('target_sheet_id'),
                 data.get('workspace_id')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'validate_cross_references':
             if not args.data:
@@ -442,7 +452,7 @@ async def main():
                 args.sheet_id,
                 data.get('fix_broken', False)
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
             
         elif args.operation == 'create_cross_reference':
             if not args.data:
@@ -454,7 +464,7 @@ async def main():
                 data.get('formula_config'),
                 data.get('row_ids')
             )
-            print(json.dumps(result, indent=2))
+            print_json(result)
         
     except Exception as e:
         error = {
@@ -462,10 +472,14 @@ async def main():
             "message": str(e),
             "type": type(e).__name__
         }
-        print(json.dumps(error, indent=2), file=sys.stderr)
+        print_json(error, file=sys.stderr)
         sys.exit(1)
 
-if __name__ == '__main__':
+def run():
+    """Synchronous entry point for console scripts and ``python -m smartsheet_ops``"""
     import multiprocessing
     multiprocessing.freeze_support()
     asyncio.run(main())
+
+if __name__ == '__main__':
+    run()
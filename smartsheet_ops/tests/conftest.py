@@ -2,10 +2,21 @@
 pytest configuration and fixtures for smartsheet_ops tests
 """
 import os
+import functools
 import pytest
 from unittest.mock import Mock, MagicMock
 from typing import Dict, Any
 
+try:
+    import smartsheet
+except ImportError:
+    smartsheet = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 # Set up test environment
 os.environ['NODE_ENV'] = 'test'
 os.environ['SMARTSHEET_API_KEY'] = 'test-api-key'
@@ -14,6 +25,66 @@ os.environ['AZURE_OPENAI_API_BASE'] = 'https://test.openai.azure.com'
 os.environ['AZURE_OPENAI_API_VERSION'] = '2024-02-15-preview'
 os.environ['AZURE_OPENAI_DEPLOYMENT'] = 'test-deployment'
 
+# Original captured at import time so the memoized wrapper below can
+# delegate to it while the session-wide patch is active
+_get_encoding = tiktoken.get_encoding if tiktoken else None
+
+@functools.lru_cache(maxsize=None)
+def cached_get_encoding(encoding_name: str):
+    """Load a tiktoken encoding once per test session"""
+    return _get_encoding(encoding_name)
+
+@pytest.fixture(scope="session", autouse=True)
+def memoize_tokenizer():
+    """Load tokenizer tables once per session; they are read-only.
+
+    Tests that patch tiktoken.get_encoding themselves still take precedence,
+    since function-scoped patches are applied on top of this one.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        if tiktoken is not None:
+            mp.setattr(tiktoken, "get_encoding", cached_get_encoding)
+        yield
+
+@pytest.fixture(scope="session")
+def smartsheet_sdk_client():
+    """One real (offline) Smartsheet SDK client, built once and shared by the session"""
+    if smartsheet is None:
+        pytest.skip("smartsheet SDK not installed")
+    client = smartsheet.Smartsheet('test-api-key')
+    client.errors_as_exceptions(True)
+    yield client
+
+@pytest.fixture(scope="session")
+def azure_openai_client():
+    """The Azure OpenAI client batch_analysis builds once at import, for tests that need it"""
+    pytest.importorskip("openai")
+    try:
+        from smartsheet_ops import batch_analysis
+    except Exception as e:
+        # Importing it loads the tokenizer, which may need a download
+        pytest.skip(f"batch_analysis could not be imported: {e}")
+    yield batch_analysis.client
+
+@pytest.fixture
+def smartsheet_operations(smartsheet_sdk_client):
+    """SmartsheetOperations on the shared SDK client, with its own caches"""
+    from smartsheet_ops import SmartsheetOperations
+    return SmartsheetOperations('test-api-key', client=smartsheet_sdk_client)
+
+# Markers for tests that hold on to large SDK state (tokenizer tables,
+# OpenAI clients). With pytest-forked installed these tests run in a forked
+# subprocess, so their memory is returned after each one.
+FORKED_MARKERS = ("healthcare",)
+
+def pytest_collection_modifyitems(config, items):
+    """Fork only the memory-hungry tests rather than the whole suite"""
+    if not config.pluginmanager.hasplugin("pytest_forked"):
+        return
+    for item in items:
+        if any(item.get_closest_marker(name) for name in FORKED_MARKERS):
+            item.add_marker(pytest.mark.forked)
+
 @pytest.fixture
 def mock_api_key():
     """Provide a test API key"""
@@ -164,4 +235,21 @@ def mock_operations_success_response():
 def suppress_logs(caplog):
     """Suppress logs during testing unless explicitly needed"""
     caplog.set_level(40)  # ERROR level
-    return caplog
\ No newline at end of file
+    return caplog
+
+@pytest.fixture
+def sheet_operations():
+    """Build SmartsheetOperations serving one in-memory sheet (see tests/mocks/in_memory_sheets.py)
+
+    No SDK client is built; each call gets its own sheet and caches.
+    """
+    if smartsheet is None:
+        pytest.skip("smartsheet SDK not installed")
+    from types import SimpleNamespace
+    from smartsheet_ops import SmartsheetOperations
+    from tests.mocks.in_memory_sheets import InMemorySheets, make_sheet
+
+    def _create(columns, rows):
+        client = SimpleNamespace(Sheets=InMemorySheets(make_sheet(columns, rows)))
+        return SmartsheetOperations('test-api-key', client=client)
+    return _create
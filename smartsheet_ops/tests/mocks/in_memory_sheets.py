@@ -0,0 +1,116 @@
+"""
+In-memory stand-in for the Smartsheet Sheets resource, backed by real SDK models
+"""
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import smartsheet
+from smartsheet.models import Row, Sheet
+
+
+def make_sheet(columns: List[Dict[str, Any]], rows: List[Dict[str, Any]], sheet_id: int = 1) -> Sheet:
+    """
+    Build an SDK Sheet from API-style dicts.
+
+    Example:
+        make_sheet(
+            [{'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True}],
+            [{'id': 101, 'cells': [{'columnId': 11, 'value': 'Write tests'}]}]
+        )
+    """
+    return Sheet({
+        'id': sheet_id,
+        'name': 'Test Sheet',
+        'columns': columns,
+        'rows': rows,
+        'totalRowCount': len(rows)
+    })
+
+
+class InMemorySheets:
+    """Serves one sheet the way the Sheets resource does, recording every call"""
+
+    def __init__(self, sheet: Sheet):
+        self.sheet = sheet
+        self.calls: List[tuple] = []
+        self._next_row_id = 900000
+
+    def get_sheet(
+        self,
+        sheet_id: Any,
+        page_size: Optional[int] = None,
+        page: Optional[int] = None,
+        column_ids: Optional[str] = None,
+        row_ids: Optional[List[int]] = None,
+        **kwargs: Any
+    ) -> SimpleNamespace:
+        self.calls.append(('get_sheet', {
+            'page_size': page_size,
+            'page': page,
+            'column_ids': column_ids,
+            'row_ids': row_ids
+        }))
+        rows = list(self.sheet.rows)
+        if row_ids is not None:
+            wanted = set(row_ids)
+            rows = [row for row in rows if row.id in wanted]
+        if page_size is not None:
+            page = page or 1
+            rows = rows[(page - 1) * page_size:page * page_size]
+        columns = list(self.sheet.columns)
+        if column_ids:
+            kept = {int(column_id) for column_id in str(column_ids).split(',')}
+            columns = [column for column in columns if column.id in kept]
+            rows = [
+                Row({
+                    'id': row.id,
+                    'cells': [cell.to_dict() for cell in row.cells if cell.column_id in kept]
+                })
+                for row in rows
+            ]
+        return SimpleNamespace(
+            id=self.sheet.id,
+            name=self.sheet.name,
+            columns=columns,
+            rows=rows,
+            total_row_count=len(self.sheet.rows)
+        )
+
+    def get_columns(self, sheet_id: Any, **kwargs: Any) -> SimpleNamespace:
+        self.calls.append(('get_columns', {}))
+        return SimpleNamespace(data=list(self.sheet.columns), total_count=len(self.sheet.columns))
+
+    def get_row(self, sheet_id: Any, row_id: Any, **kwargs: Any) -> Row:
+        self.calls.append(('get_row', {'row_id': row_id}))
+        for row in self.sheet.rows:
+            if str(row.id) == str(row_id):
+                return row
+        raise smartsheet.exceptions.ApiError(
+            SimpleNamespace(result=SimpleNamespace(error_code=1006)),
+            'Not Found'
+        )
+
+    def add_rows(self, sheet_id: Any, rows: List[Row]) -> List[SimpleNamespace]:
+        self.calls.append(('add_rows', rows))
+        created = []
+        for _ in rows:
+            self._next_row_id += 1
+            created.append(SimpleNamespace(id=self._next_row_id))
+        return created
+
+    def update_rows(self, sheet_id: Any, rows: List[Row]) -> List[SimpleNamespace]:
+        self.calls.append(('update_rows', rows))
+        return [SimpleNamespace(id=row.id_) for row in rows]
+
+    def delete_rows(self, sheet_id: Any, row_ids: List[int], ignore_rows_not_found: bool = False) -> SimpleNamespace:
+        self.calls.append(('delete_rows', row_ids))
+        existing = {row.id for row in self.sheet.rows}
+        return SimpleNamespace(result=[row_id for row_id in row_ids if row_id in existing])
+
+    def update_column(self, sheet_id: Any, column_id: Any, column: Any) -> SimpleNamespace:
+        self.calls.append(('update_column', column_id, column))
+        return SimpleNamespace(result=column)
+
+    def delete_column(self, sheet_id: Any, column_id: Any) -> SimpleNamespace:
+        self.calls.append(('delete_column', column_id))
+        return SimpleNamespace(result=None)
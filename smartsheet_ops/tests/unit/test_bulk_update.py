@@ -0,0 +1,130 @@
+"""
+Tests for bulk_update's batch sending and failure reporting
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("smartsheet")
+
+COLUMNS = [
+    {'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True},
+    {'id': 12, 'title': 'Status', 'type': 'TEXT_NUMBER'},
+]
+SHEET_ROWS = [
+    {'id': 100 + i, 'cells': [{'columnId': 11, 'value': f'row {i}'}, {'columnId': 12, 'value': 'Open'}]}
+    for i in range(1, 6)
+]
+# Has no columnId, so it fails on every row
+MISSING_COLUMN_RULE = {'conditions': [{'operator': 'equals', 'value': 'Open'}], 'updates': []}
+CLOSE_RULE = {
+    'conditions': [{'columnId': '12', 'operator': 'equals', 'value': 'Open'}],
+    'updates': [{'columnId': '12', 'value': 'Closed'}]
+}
+
+
+def record_batches(ops, fail_row_ids=()):
+    """Log fetched pages and finished batches in order; fail batches holding fail_row_ids"""
+    ops.get_sheet_info('1')  # cache it so only row pages are logged
+    sheets = ops.client.Sheets
+    events = []
+    get_sheet = sheets.get_sheet
+
+    def logged_get_sheet(sheet_id, **kwargs):
+        events.append(('page', kwargs.get('page')))
+        return get_sheet(sheet_id, **kwargs)
+
+    def update_rows(sheet_id, rows):
+        row_ids = [row.id_ for row in rows]
+        if set(row_ids) & set(fail_row_ids):
+            events.append(('failed', row_ids))
+            raise RuntimeError('Rate limit exceeded')
+        events.append(('updated', row_ids))
+        return [SimpleNamespace(id=row_id) for row_id in row_ids]
+    sheets.get_sheet = logged_get_sheet
+    sheets.update_rows = update_rows
+    return events
+
+
+def test_every_failure_is_kept_by_default(sheet_operations):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    result = ops.bulk_update('1', [MISSING_COLUMN_RULE], {'lenientMode': True, 'batchSize': 2})
+    assert result['failureCount'] == 5
+    assert [failure['rowId'] for failure in result['failures']] == ['101', '102', '103', '104', '105']
+    assert 'failuresTruncated' not in result
+
+
+@pytest.mark.parametrize('retained, kept, truncated', [
+    (2, ['104', '105'], True),
+    (5, ['101', '102', '103', '104', '105'], False),
+])
+def test_max_failures_retained_keeps_the_most_recent(sheet_operations, retained, kept, truncated):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    seen = []
+    result = ops.bulk_update('1', [MISSING_COLUMN_RULE], {
+        'lenientMode': True,
+        'batchSize': 2,
+        'maxFailuresRetained': retained,
+        'onFailure': seen.append
+    })
+    assert result['failureCount'] == 5
+    assert [failure['rowId'] for failure in result['failures']] == kept
+    assert result['failuresTruncated'] is truncated
+    assert len(seen) == 5
+
+
+@pytest.mark.parametrize('concurrency', [1, 2, 3])
+def test_batches_are_sent_while_later_pages_are_read(sheet_operations, concurrency):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    events = record_batches(ops)
+    result = ops.bulk_update('1', [CLOSE_RULE], {'batchSize': 1, 'concurrency': concurrency})
+    assert result['successCount'] == 5
+
+    # Page n is only read once batch n - concurrency has finished, so at
+    # most one page per worker is held
+    pages = [page for kind, page in events if kind == 'page']
+    assert pages == [1, 2, 3, 4, 5]
+    for page in pages[concurrency:]:
+        finished_row = 100 + page - concurrency
+        assert events.index(('updated', [finished_row])) < events.index(('page', page))
+
+
+@pytest.mark.parametrize('concurrency, applied, sent', [
+    (1, [0], [[101], [102]]),
+    (2, [0, 2], [[101], [102], [103]]),
+])
+def test_failed_batch_stops_further_batches_in_strict_mode(sheet_operations, concurrency, applied, sent):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    events = record_batches(ops, fail_row_ids=[102])
+    with pytest.raises(RuntimeError) as raised:
+        ops.bulk_update('1', [CLOSE_RULE], {'batchSize': 1, 'concurrency': concurrency})
+    assert str(raised.value) == (
+        'Failed to perform bulk update: Batch 1 failed: Rate limit exceeded; '
+        f'{len(applied)} rows in batches {applied} were already updated'
+    )
+    assert sorted(row_ids for kind, row_ids in events if kind in ('updated', 'failed')) == sent
+
+
+def test_failed_batch_is_reported_in_lenient_mode(sheet_operations):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    record_batches(ops, fail_row_ids=[102])
+    result = ops.bulk_update('1', [CLOSE_RULE], {'batchSize': 2, 'concurrency': 2, 'lenientMode': True})
+    assert result['successCount'] == 3
+    assert result['failures'] == [
+        {'rowId': '101', 'error': 'Rate limit exceeded', 'rollbackStatus': 'failed'},
+        {'rowId': '102', 'error': 'Rate limit exceeded', 'rollbackStatus': 'failed'},
+    ]
+
+
+def test_row_error_on_a_later_page_reports_sent_batches(sheet_operations):
+    rows = [dict(row) for row in SHEET_ROWS]
+    rows[2] = {'id': 103, 'cells': [{'columnId': 11, 'value': 'row 3'}, {'columnId': 12, 'value': 'Bad'}]}
+    bad_rule = {
+        'conditions': [{'columnId': '12', 'operator': 'equals', 'value': 'Bad'}],
+        'updates': [{'columnId': 'not-a-column', 'value': 'x'}]
+    }
+    ops = sheet_operations(COLUMNS, rows)
+    events = record_batches(ops)
+    with pytest.raises(RuntimeError, match=r'2 rows in batches \[0, 1\] were already updated$'):
+        ops.bulk_update('1', [CLOSE_RULE, bad_rule], {'batchSize': 1, 'concurrency': 1})
+    assert [row_ids for kind, row_ids in events if kind == 'updated'] == [[101], [102]]
@@ -0,0 +1,50 @@
+"""
+Tests for delete_rows' reading of the API's deleted row IDs
+"""
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("smartsheet")
+
+COLUMNS = [{'id': 11, 'title': 'Task Name', 'type': 'TEXT_NUMBER', 'primary': True}]
+ROWS = [
+    {'id': 101, 'cells': [{'columnId': 11, 'value': 'First'}]},
+    {'id': 102, 'cells': [{'columnId': 11, 'value': 'Second'}]},
+]
+
+
+def test_validates_rows_by_default(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS)
+    result = ops.delete_rows('1', ['101', '999'])
+    assert result['rows_deleted'] == 1
+    assert result['failed_deletes'] == [{'row_id': '999', 'reason': 'Row not found'}]
+    deletes = [call for call in ops.client.Sheets.calls if call[0] == 'delete_rows']
+    assert deletes == [('delete_rows', ['101'])]
+
+
+def test_listed_ids_are_deleted_and_missing_ones_reported(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS)
+    result = ops.delete_rows('1', ['101', '999', 'abc'], validate=False)
+    assert result['rows_deleted'] == 1
+    assert result['failed_deletes'] == [
+        {'row_id': 'abc', 'reason': 'Row not found'},
+        {'row_id': '999', 'reason': 'Row not found'},
+    ]
+
+
+def test_unlisted_response_marks_every_row_unconfirmed(sheet_operations, caplog):
+    ops = sheet_operations(COLUMNS, ROWS)
+    ops.client.Sheets.delete_rows = lambda *args, **kwargs: SimpleNamespace(message='SUCCESS', result=None)
+    with caplog.at_level(logging.WARNING, logger='smartsheet_ops'):
+        result = ops.delete_rows('1', ['101', '102'], validate=False)
+    assert result == {
+        'message': 'Deletion not confirmed',
+        'rows_deleted': 0,
+        'failed_deletes': [
+            {'row_id': '101', 'reason': 'Deletion not confirmed'},
+            {'row_id': '102', 'reason': 'Deletion not confirmed'},
+        ]
+    }
+    assert 'unconfirmed' in caplog.text
@@ -0,0 +1,45 @@
+"""
+Tests for the shared test fixtures in conftest.py
+"""
+import pytest
+
+smartsheet = pytest.importorskip("smartsheet")
+
+
+def test_operations_share_the_session_sdk_client(smartsheet_sdk_client, smartsheet_operations):
+    assert isinstance(smartsheet_sdk_client, smartsheet.Smartsheet)
+    assert smartsheet_operations.client is smartsheet_sdk_client
+
+
+def test_operations_on_a_shared_client_keep_separate_caches(smartsheet_sdk_client, smartsheet_operations):
+    from smartsheet_ops import SmartsheetOperations
+    other = SmartsheetOperations('test-api-key', client=smartsheet_sdk_client)
+    smartsheet_operations._sheet_info_cache['1'] = (0.0, {'column_map': {}})
+    assert '1' not in other._sheet_info_cache
+
+
+def test_in_memory_operations_are_isolated(sheet_operations):
+    columns = [{'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True}]
+    first = sheet_operations(columns, [{'id': 101, 'cells': [{'columnId': 11, 'value': 'a'}]}])
+    second = sheet_operations(columns, [])
+    first.delete_rows('1', ['101'])
+    assert [call[0] for call in second.client.Sheets.calls] == []
+    assert second.get_sheet_info('1')['sample_data'] == []
+
+
+def test_tokenizer_is_memoized():
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        pytest.skip(f"cl100k_base not available offline: {e}")
+    assert tiktoken.get_encoding("cl100k_base") is encoding
+
+
+def test_batch_processor_reuses_the_shared_openai_client(azure_openai_client):
+    from smartsheet_ops.batch_analysis import BatchProcessor
+    first = BatchProcessor()
+    second = BatchProcessor()
+    assert first.prompt_optimizer is azure_openai_client
+    assert second.prompt_optimizer is azure_openai_client
+    assert first.encoder is second.encoder
@@ -0,0 +1,121 @@
+"""
+Tests for add_hierarchical_rows' batching of same-location rows
+
+The sheet below follows the API's location rules: the rows of one add_rows
+request are inserted together, in request order, at the request's location.
+Batched requests must leave the sheet in the same order as sending each row
+on its own.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("smartsheet")
+
+COLUMNS = [{'id': 11, 'title': 'Task Name', 'type': 'TEXT_NUMBER', 'primary': True}]
+EXISTING_ROWS = [
+    {'id': 101, 'cells': [{'columnId': 11, 'value': 'Parent'}]},
+    {'id': 102, 'cells': [{'columnId': 11, 'value': 'Sibling'}]},
+]
+COLUMN_MAP = {'Task Name': '11'}
+
+
+def install_location_rules(ops):
+    """Make add_rows place rows like the API, tracking children per parent"""
+    sheets = ops.client.Sheets
+    children = {None: [101, 102], 101: [], 102: []}
+    parent_of = {101: None, 102: None}
+    names = {101: 'Parent', 102: 'Sibling'}
+    requests = []
+
+    def add_rows(sheet_id, rows):
+        ids = []
+        for row in rows:
+            sheets._next_row_id += 1
+            ids.append(sheets._next_row_id)
+            names[sheets._next_row_id] = row.cells[0].value
+            children[sheets._next_row_id] = []
+        first = rows[0]
+        if first.sibling_id is not None:
+            parent = parent_of[first.sibling_id]
+            position = children[parent].index(first.sibling_id) + (0 if first.above else 1)
+        else:
+            parent = first.parent_id
+            position = 0 if first.to_top or (parent is not None and not first.to_bottom) else len(children[parent])
+        children[parent][position:position] = ids
+        for row_id in ids:
+            parent_of[row_id] = parent
+        requests.append([row.cells[0].value for row in rows])
+        return [SimpleNamespace(id=row_id) for row_id in ids]
+    sheets.add_rows = add_rows
+
+    def sheet_order(parent=None):
+        order = []
+        for row_id in children[parent]:
+            order.append(names[row_id])
+            order.extend(sheet_order(row_id))
+        return order
+    return requests, sheet_order, names
+
+
+ROW_DATA = [
+    {'Task Name': 'T1', 'toTop': True},
+    {'Task Name': 'T2', 'toTop': True},
+    {'Task Name': 'B1'},
+    {'Task Name': 'B2', 'toBottom': True},
+    {'Task Name': 'C1', 'parentId': '101'},
+    {'Task Name': 'C2', 'parentId': '101'},
+    {'Task Name': 'L1', 'parentId': '101', 'toBottom': True},
+    {'Task Name': 'L2', 'parentId': '101', 'toBottom': True},
+    {'Task Name': 'S1', 'siblingId': 102},
+    {'Task Name': 'S2', 'siblingId': 102},
+    {'Task Name': 'A1', 'siblingId': 102, 'above': True},
+    {'Task Name': 'A2', 'siblingId': 102, 'above': True},
+    {'Task Name': 'T3', 'toTop': True},
+]
+
+
+def test_location_groups(sheet_operations):
+    ops = sheet_operations(COLUMNS, EXISTING_ROWS)
+    assert list(ops._location_groups(ROW_DATA)) == [
+        ([0, 1], True),        # toTop
+        ([2], False),          # no location: bottom
+        ([3], False),          # toBottom
+        ([4, 5], True),        # bare parentId: first child
+        ([6, 7], False),       # parentId + toBottom
+        ([8, 9], True),        # below a sibling
+        ([10, 11], False),     # above a sibling
+        ([12], True),
+    ]
+
+
+def test_batched_rows_end_up_in_one_by_one_order(sheet_operations):
+    one_by_one = sheet_operations(COLUMNS, EXISTING_ROWS)
+    _, one_by_one_order, _ = install_location_rules(one_by_one)
+    for data in ROW_DATA:
+        one_by_one.add_rows('1', [data], COLUMN_MAP)
+
+    batched = sheet_operations(COLUMNS, EXISTING_ROWS)
+    requests, batched_order, names = install_location_rules(batched)
+    result = batched.add_hierarchical_rows('1', ROW_DATA, COLUMN_MAP)
+
+    assert batched_order() == one_by_one_order()
+    # Same-location runs share a request; stacking runs are sent reversed
+    assert requests == [['T2', 'T1'], ['B1'], ['B2'], ['C2', 'C1'], ['L1', 'L2'],
+                        ['S2', 'S1'], ['A1', 'A2'], ['T3']]
+
+    # Created rows map back to their input rows
+    assert [row['index'] for row in result['created_rows']] == list(range(len(ROW_DATA)))
+    for row in result['created_rows']:
+        assert names[int(row['row_id'])] == ROW_DATA[row['index']]['Task Name']
+        assert row['task_name'] == ROW_DATA[row['index']]['Task Name']
+    assert result['row_id_map'] == {row['index']: row['row_id'] for row in result['created_rows']}
+    assert result['rows_added'] == len(ROW_DATA)
+
+
+def test_iter_add_hierarchical_rows_yields_each_request(sheet_operations):
+    ops = sheet_operations(COLUMNS, EXISTING_ROWS)
+    install_location_rules(ops)
+    waves = list(ops.iter_add_hierarchical_rows('1', ROW_DATA[:3], COLUMN_MAP))
+    assert [wave['wave'] for wave in waves] == [0, 1]
+    assert [[row['index'] for row in wave['created_rows']] for wave in waves] == [[0, 1], [2]]
@@ -0,0 +1,159 @@
+"""
+Tests for bulk_update's column-wise condition evaluation (_rule_mask)
+
+Every case is checked against _evaluate_conditions, the row-at-a-time
+reference implementation.
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("smartsheet")
+
+OPERATORS = ['equals', 'contains', 'greaterThan', 'lessThan', 'isEmpty', 'isNotEmpty', 'bogus']
+CELL_VALUES = [None, '', ' ', 'a', 'abc', '3', 5, 2.5, True, '2024-01-02', '2024-01-02T00:00:00Z', 'not a date']
+EXPECTED_VALUES = ['a', '3', 2, None, '2024-01-01', '2024-13-45', 'garbage']
+CELL_TYPES = ['TEXT_NUMBER', 'PICKLIST', 'DATE', 'CHECKBOX']
+
+
+def make_row(values):
+    """Build a row from {column id: value}; columns left out have no cell"""
+    return SimpleNamespace(cells=[
+        SimpleNamespace(column_id=column_id, value=value)
+        for column_id, value in values.items()
+    ])
+
+
+def assert_mask_matches_rows(ops, conditions, col_type_by_id, rows):
+    expected = [ops._evaluate_conditions(conditions, row, {}, col_type_by_id) for row in rows]
+
+    batch_cells = [ops._cells_by_column(row) for row in rows]
+    batch_value_columns = [
+        frozenset(column_id for column_id, cell in cells.items() if cell.value is not None)
+        for cells in batch_cells
+    ]
+    compiled = ops._compile_conditions(conditions, col_type_by_id)
+
+    # Plain, with the required-column pre-mask, and reusing gathered columns
+    assert ops._rule_mask(compiled, batch_cells) == expected
+    batch_columns = {}
+    for _ in range(2):
+        assert ops._rule_mask(
+            compiled,
+            batch_cells,
+            ops._required_value_columns(conditions),
+            batch_value_columns,
+            batch_columns
+        ) == expected
+    return expected
+
+
+@pytest.fixture
+def ops(sheet_operations):
+    return sheet_operations([], [])
+
+
+ROWS = [
+    make_row({'1': 'abc', '2': '2024-01-02'}),
+    make_row({'1': None, '2': None}),
+    make_row({'1': ''}),                       # no DATE cell at all
+    make_row({}),                              # no cells at all
+    make_row({'1': 5, '2': 'not a date'}),
+    make_row({'1': 'a', '2': '2024-01-02T00:00:00Z'}),
+]
+TYPES = {'1': 'TEXT_NUMBER', '2': 'DATE'}
+
+
+@pytest.mark.parametrize('conditions, expected', [
+    # A missing cell fails every operator, isEmpty included; None is empty
+    ([{'columnId': '1', 'operator': 'isEmpty'}], [False, True, True, False, False, False]),
+    ([{'columnId': '2', 'operator': 'isEmpty'}], [False, True, False, False, False, False]),
+    ([{'columnId': '1', 'operator': 'isNotEmpty'}], [True, False, False, False, True, True]),
+    ([{'columnId': '1', 'operator': 'equals', 'value': None}], [False] * 6),
+    ([{'columnId': '1', 'operator': 'contains', 'value': None}], [False] * 6),
+    ([{'columnId': '1', 'operator': 'contains', 'value': 'a'}], [True, False, False, False, False, True]),
+    ([{'columnId': '1', 'operator': 'bogus', 'value': 'a'}], [False] * 6),
+    # Unparseable or mixed naive/aware dates fail rather than raise
+    ([{'columnId': '2', 'operator': 'greaterThan', 'value': '2024-01-01'}], [True, False, False, False, False, False]),
+    ([{'columnId': '2', 'operator': 'lessThan', 'value': '2024-13-45'}], [False] * 6),
+    ([{'columnId': '2', 'operator': 'equals', 'value': 'garbage'}], [False] * 6),
+    # AND across columns, including an isEmpty on a missing cell
+    ([{'columnId': '1', 'operator': 'isNotEmpty'}, {'columnId': '2', 'operator': 'isEmpty'}], [False] * 6),
+    ([{'columnId': '1', 'operator': 'equals', 'value': 'abc'},
+      {'columnId': '2', 'operator': 'lessThan', 'value': '2024-02-01'}], [True, False, False, False, False, False]),
+])
+def test_rule_mask_cases(ops, conditions, expected):
+    assert assert_mask_matches_rows(ops, conditions, TYPES, ROWS) == expected
+
+
+def test_rule_mask_matches_row_evaluation_on_random_rules(ops):
+    rng = random.Random(3)
+    for _ in range(500):
+        rows = [
+            make_row({
+                str(column_id): rng.choice(CELL_VALUES)
+                for column_id in rng.sample(range(1, 5), rng.randint(0, 4))
+            })
+            for _ in range(6)
+        ]
+        conditions = [
+            {
+                'columnId': str(rng.randint(1, 4)),
+                'operator': rng.choice(OPERATORS),
+                'value': rng.choice(EXPECTED_VALUES)
+            }
+            for _ in range(rng.randint(1, 3))
+        ]
+        col_type_by_id = {str(i): rng.choice(CELL_TYPES) for i in range(1, 5)}
+        assert_mask_matches_rows(ops, conditions, col_type_by_id, rows)
+
+
+COLUMNS = [
+    {'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True},
+    {'id': 12, 'title': 'Status', 'type': 'PICKLIST', 'options': ['Open', 'Done']},
+]
+SHEET_ROWS = [
+    {'id': 101, 'cells': [{'columnId': 11, 'value': 'a'}, {'columnId': 12, 'value': 'Open'}]},
+    {'id': 102, 'cells': [{'columnId': 11, 'value': 'b'}, {'columnId': 12, 'value': 'Done'}]},
+]
+MISSING_COLUMN_RULE = {'conditions': [{'operator': 'equals', 'value': 'Open'}], 'updates': []}
+BAD_UPDATE_RULE = {
+    'conditions': [{'columnId': '12', 'operator': 'equals', 'value': 'Open'}],
+    'updates': [{'columnId': 'not-a-column', 'value': 'x'}]
+}
+GOOD_RULE = {
+    'conditions': [{'columnId': '12', 'operator': 'equals', 'value': 'Done'}],
+    'updates': [{'columnId': '11', 'value': 'finished'}]
+}
+
+
+def update_calls(ops):
+    return [call for call in ops.client.Sheets.calls if call[0] == 'update_rows']
+
+
+def test_malformed_condition_fails_every_row_in_lenient_mode(sheet_operations):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    result = ops.bulk_update('1', [MISSING_COLUMN_RULE], {'lenientMode': True})
+    assert result['totalAttempted'] == 2
+    assert result['successCount'] == 0
+    assert [failure['rowId'] for failure in result['failures']] == ['101', '102']
+    assert {failure['rollbackStatus'] for failure in result['failures']} == {'not_attempted'}
+    assert update_calls(ops) == []
+
+
+def test_malformed_update_fails_only_matching_rows_in_lenient_mode(sheet_operations):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    result = ops.bulk_update('1', [BAD_UPDATE_RULE, GOOD_RULE], {'lenientMode': True})
+    assert [failure['rowId'] for failure in result['failures']] == ['101']
+    assert result['successCount'] == 1
+    (_, rows), = update_calls(ops)
+    assert [row.id_ for row in rows] == [102]
+
+
+@pytest.mark.parametrize('rule', [MISSING_COLUMN_RULE, BAD_UPDATE_RULE])
+def test_malformed_rule_raises_in_strict_mode(sheet_operations, rule):
+    ops = sheet_operations(COLUMNS, SHEET_ROWS)
+    with pytest.raises(RuntimeError, match='Failed to perform bulk update'):
+        ops.bulk_update('1', [rule, GOOD_RULE], {})
+    assert update_calls(ops) == []
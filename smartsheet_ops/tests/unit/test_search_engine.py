@@ -0,0 +1,34 @@
+"""
+Tests for choosing the regex engine in search_sheet
+"""
+import pytest
+
+pytest.importorskip("smartsheet")
+
+import smartsheet_ops
+
+COLUMNS = [{'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True}]
+ROWS = [{'id': 101, 'cells': [{'columnId': 11, 'value': 'café au lait'}]}]
+
+
+def test_regex_search_uses_re_by_default(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS)
+    # re's \w covers 'é'; RE2's doesn't
+    result = ops.search_sheet('1', r'caf\w\b', {'regex': True})
+    assert result['row_ids'] == ['101']
+
+
+def test_re2_is_opt_in(sheet_operations):
+    if smartsheet_ops.re2 is None:
+        pytest.skip("google-re2 not installed")
+    ops = sheet_operations(COLUMNS, ROWS)
+    result = ops.search_sheet('1', r'caf\w\b', {'regex': True, 'engine': 're2'})
+    assert result['row_ids'] == []
+
+
+def test_re2_falls_back_to_re_for_unsupported_syntax(sheet_operations):
+    if smartsheet_ops.re2 is None:
+        pytest.skip("google-re2 not installed")
+    ops = sheet_operations(COLUMNS, ROWS)
+    result = ops.search_sheet('1', r'(a)u l\1', {'regex': True, 'engine': 're2'})
+    assert result['row_ids'] == ['101']
@@ -0,0 +1,64 @@
+"""
+Tests that the Hyperscan prefilter never changes search results
+"""
+import random
+import re
+
+import pytest
+
+pytest.importorskip("smartsheet")
+pytest.importorskip("hyperscan")
+
+VALUES = [
+    'Project plan', 'project done', 'done', 'Done\n', 'multi\nline done',
+    'a', 'aaa', 'b', '', ' ', 'x{,3}', '123', 'tab\there', 'sep\x1cchar',
+    'ÉCOLE', 'école', 'straße', 'STRASSE', 'ſ s', 'K kelvin', 'İstanbul',
+    'naïve café', '٣ digits', 'ﬁle', 'FILE'
+]
+
+PATTERNS = [
+    r'\AProject', r'done\Z', r'\A', r'\Z', r'done$', r'^done', r'^$', r'a{,3}',
+    r'a{2,}', r'a*', r'\bcafé\b', r'école', 'STRASSE', 's', 'k', 'istanbul',
+    'file', r'\d+', r'\s', r'\w+\s\w+', r'(?s)multi.line', r'multi.line',
+    r'(a)\1', r'(?<=a)a', r'a(?!a)', r'\Bo', r'(?m)^done$', r'[^a-z]'
+]
+
+
+def assert_same_spans(ops, pattern_re, values):
+    expected = ops._find_pattern_spans(pattern_re, values, use_hyperscan=False)
+    assert ops._find_pattern_spans(pattern_re, values, use_hyperscan=True) == expected
+    rows = list(range(len(values)))
+    assert ops._find_matching_rows(pattern_re, values, rows, use_hyperscan=True) == \
+        ops._find_matching_rows(pattern_re, values, rows, use_hyperscan=False)
+
+
+@pytest.mark.parametrize('flags', [0, re.IGNORECASE])
+@pytest.mark.parametrize('pattern', PATTERNS)
+def test_prefilter_matches_plain_re(sheet_operations, pattern, flags):
+    ops = sheet_operations([], [])
+    assert_same_spans(ops, re.compile(pattern, flags), VALUES)
+
+
+def test_prefilter_matches_plain_re_on_random_text(sheet_operations):
+    ops = sheet_operations([], [])
+    rng = random.Random(7)
+    alphabet = 'abAB \n\t{},3_é'
+    for _ in range(200):
+        values = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))) for _ in range(8)]
+        pattern = ''.join(rng.choice(['a', 'b', 'B', ' ', '^', '$', r'\b', r'\s', '.', '*', '+', r'\A', r'\Z', '{,2}', 'é'])
+                          for _ in range(rng.randint(1, 4)))
+        try:
+            pattern_re = re.compile(pattern, rng.choice([0, re.IGNORECASE]))
+        except re.error:
+            continue
+        assert_same_spans(ops, pattern_re, values)
+
+
+def test_search_sheet_results_do_not_depend_on_engine(sheet_operations):
+    columns = [{'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True}]
+    rows = [{'id': 101 + i, 'cells': [{'columnId': 11, 'value': value}]} for i, value in enumerate(VALUES) if value]
+    ops = sheet_operations(columns, rows)
+    for pattern in (r'\AProject', r'done\Z', 'istanbul', r'a{,3}'):
+        options = {'regex': True}
+        assert ops.search_sheet('1', pattern, dict(options, engine='hyperscan')) == \
+            ops.search_sheet('1', pattern, dict(options, engine='re'))
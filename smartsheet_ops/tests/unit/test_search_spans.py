@@ -0,0 +1,126 @@
+"""
+Tests for the search helpers: joined-buffer span finding, first-match row
+lookup (ids_only) and sheet paging
+"""
+import re
+
+import pytest
+
+pytest.importorskip("smartsheet")
+
+from smartsheet_ops import SEARCH_SEPARATOR, compile_search_pattern
+
+
+@pytest.fixture
+def ops(sheet_operations):
+    return sheet_operations([], [])
+
+
+def per_value_spans(pattern_re, values):
+    return [[match.span() for match in pattern_re.finditer(value)] for value in values]
+
+
+@pytest.mark.parametrize('raw, whole_word, values, expected', [
+    # Empty pattern: an empty match at every position of every value
+    ('', False, ['ab', '', 'c'], [[(0, 0), (1, 1), (2, 2)], [(0, 0)], [(0, 0), (1, 1)]]),
+    # Empty cells between matching ones
+    ('a', False, ['', 'a', '', '', 'ba'], [[], [(0, 1)], [], [], [(1, 2)]]),
+    # Whole words at the start and end of cells, and across the separator
+    ('foo', True, ['foo', 'foo bar', 'barfoo', 'foobar', 'x foo'],
+     [[(0, 3)], [(0, 3)], [], [], [(2, 5)]]),
+    # Several matches in one cell, including adjacent ones
+    ('ab', False, ['abab ab', 'xab', 'ab'], [[(0, 2), (2, 4), (5, 7)], [(1, 3)], [(0, 2)]]),
+    # Case-insensitive matches at a cell's last character
+    ('X', False, ['ax', 'X', 'xx'], [[(1, 2)], [(0, 1)], [(0, 1), (1, 2)]]),
+])
+def test_find_pattern_spans(ops, raw, whole_word, values, expected):
+    pattern_re = compile_search_pattern(raw, re.IGNORECASE, whole_word, False)
+    assert per_value_spans(pattern_re, values) == expected
+    assert ops._find_pattern_spans(pattern_re, values) == expected
+    assert ops._find_pattern_spans(pattern_re, values, scan_once=True) == expected
+
+
+def test_find_pattern_spans_with_no_values(ops):
+    pattern_re = compile_search_pattern('a', 0, False, False)
+    assert ops._find_pattern_spans(pattern_re, [], scan_once=True) == []
+
+
+@pytest.mark.parametrize('raw, whole_word', [('', False), ('a', False), ('ab', True), ('b', True)])
+def test_find_matching_rows(ops, raw, whole_word):
+    values = ['', 'ab', 'xab', '', 'b a', 'ab ab', 'zzz', 'b']
+    value_rows = [0, 0, 1, 2, 2, 3, 4, 5]
+    pattern_re = compile_search_pattern(raw, re.IGNORECASE, whole_word, False)
+    expected = {
+        row for row, spans in zip(value_rows, per_value_spans(pattern_re, values)) if spans
+    }
+    for scan_once in (False, True):
+        assert ops._find_matching_rows(pattern_re, values, value_rows, scan_once=scan_once) == expected
+
+
+def test_find_matching_rows_resumes_at_next_row(ops):
+    # Row 0 matches in its first value; the scan must still find row 1's
+    # match, which follows more of row 0's matching values
+    values = ['a', 'a', 'a', 'b', 'a']
+    value_rows = [0, 0, 0, 1, 1]
+    pattern_re = compile_search_pattern('a', 0, False, False)
+    assert ops._find_matching_rows(pattern_re, values, value_rows, scan_once=True) == {0, 1}
+
+
+def test_ids_only_search_finds_the_same_rows(sheet_operations):
+    columns = [
+        {'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True},
+        {'id': 12, 'title': 'Notes', 'type': 'TEXT_NUMBER'},
+        {'id': 13, 'title': 'Status', 'type': 'PICKLIST', 'options': ['foo', 'bar']},
+    ]
+    cells = [
+        ('foo', 'foo foo', 'bar'), ('', 'xfoo', None), ('bar', None, 'foo'),
+        ('a' + SEARCH_SEPARATOR + 'foo', 'foo', 'bar'), (None, None, None), ('Foo', '', 'bar'),
+    ]
+    rows = [
+        {'id': 101 + i, 'cells': [
+            {'columnId': column_id, 'value': value}
+            for column_id, value in zip((11, 12, 13), values) if value is not None
+        ]}
+        for i, values in enumerate(cells)
+    ]
+    ops = sheet_operations(columns, rows)
+    for pattern, options in [('foo', {}), ('foo', {'whole_word': True}), ('foo', {'case_sensitive': True}),
+                             ('', {}), (r'fo+\b', {'regex': True}), ('bar', {'columns': ['Status']})]:
+        full = ops.search_sheet('1', pattern, options)
+        ids_only = ops.search_sheet('1', pattern, dict(options, ids_only=True))
+        assert ids_only['row_ids'] == full['row_ids']
+        assert ids_only['matches'] == []
+
+
+def page_requests(ops):
+    return [call[1]['page'] for call in ops.client.Sheets.calls if call[0] == 'get_sheet']
+
+
+def sheet_with_rows(sheet_operations, count):
+    columns = [{'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True}]
+    rows = [{'id': 101 + i, 'cells': [{'columnId': 11, 'value': str(i)}]} for i in range(count)]
+    return sheet_operations(columns, rows)
+
+
+@pytest.mark.parametrize('count, pages', [(0, [1]), (1, [1]), (3, [1, 2]), (5, [1, 2, 3]), (6, [1, 2, 3])])
+def test_iter_sheet_pages(sheet_operations, count, pages):
+    ops = sheet_with_rows(sheet_operations, count)
+    fetched = [row.id for page in ops._iter_sheet_pages('1', page_size=2) for row in page.rows]
+    assert fetched == [101 + i for i in range(count)]
+    assert page_requests(ops) == pages
+
+
+def test_iter_sheet_pages_without_total_row_count(sheet_operations):
+    # An exact multiple of page_size then needs one more, empty, page
+    ops = sheet_with_rows(sheet_operations, 4)
+    get_sheet = ops.client.Sheets.get_sheet
+
+    def get_sheet_without_total(*args, **kwargs):
+        page = get_sheet(*args, **kwargs)
+        page.total_row_count = None
+        return page
+    ops.client.Sheets.get_sheet = get_sheet_without_total
+
+    fetched = [row.id for page in ops._iter_sheet_pages('1', page_size=2) for row in page.rows]
+    assert fetched == [101, 102, 103, 104]
+    assert page_requests(ops) == [1, 2, 3]
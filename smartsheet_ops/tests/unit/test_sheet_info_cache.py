@@ -0,0 +1,35 @@
+"""
+Tests for get_sheet_info's cache handing out independent results
+"""
+import pytest
+
+pytest.importorskip("smartsheet")
+
+COLUMNS = [
+    {'id': 11, 'title': 'Task Name', 'type': 'TEXT_NUMBER', 'primary': True},
+    {'id': 12, 'title': 'Status', 'type': 'PICKLIST', 'options': ['Open', 'Done']},
+]
+ROWS = [{'id': 101, 'cells': [{'columnId': 11, 'value': 'First'}, {'columnId': 12, 'value': 'Open'}]}]
+
+
+def test_mutating_a_result_leaves_the_cache_intact(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS)
+    first = ops.get_sheet_info('1')
+    expected = ops.get_sheet_info('1')
+
+    first['column_map']['Task Name'] = 'changed'
+    first['column_info']['Status']['debug'].clear()
+    del first['column_info']['Task Name']
+    first['sample_data'].append({})
+    first.clear()
+
+    assert ops.get_sheet_info('1') == expected
+    assert sum(1 for call in ops.client.Sheets.calls if call[0] == 'get_sheet') == 1
+
+
+def test_load_schema_returns_independent_maps(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS)
+    column_map, column_info = ops.load_schema('1')
+    column_map.clear()
+    column_info.clear()
+    assert ops.load_schema('1')[0] == {'Task Name': '11', 'Status': '12'}
@@ -0,0 +1,52 @@
+"""
+Tests for update_rows_bulk's handling of failed batches
+"""
+import pytest
+
+pytest.importorskip("smartsheet")
+
+COLUMNS = [{'id': 11, 'title': 'Task', 'type': 'TEXT_NUMBER', 'primary': True}]
+ROWS = [{'id': 101 + i, 'cells': [{'columnId': 11, 'value': f'Task {i}'}]} for i in range(5)]
+UPDATES = [{'row_id': str(101 + i), 'data': {'Task': f'Done {i}'}} for i in range(5)]
+
+
+def fail_batches_with(ops, failing_row_id):
+    """Make update_rows requests containing failing_row_id raise"""
+    sheets = ops.client.Sheets
+    update_rows = sheets.update_rows
+
+    def flaky_update_rows(sheet_id, rows):
+        if any(row.id_ == failing_row_id for row in rows):
+            raise RuntimeError('Rate limit exceeded')
+        return update_rows(sheet_id, rows)
+    sheets.update_rows = flaky_update_rows
+
+
+def test_all_batches_succeed(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS)
+    result = ops.update_rows_bulk('1', UPDATES, {'Task': '11'}, batch_size=2)
+    assert result['row_ids'] == [update['row_id'] for update in UPDATES]
+    assert result['batches'] == 3
+    assert 'failed_batches' not in result
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_failed_batch_keeps_other_results(sheet_operations, concurrency):
+    ops = sheet_operations(COLUMNS, ROWS)
+    fail_batches_with(ops, 103)
+
+    result = ops.update_rows_bulk('1', UPDATES, {'Task': '11'}, batch_size=2, concurrency=concurrency)
+
+    assert result['message'] == 'Partially updated rows'
+    assert result['row_ids'] == ['101', '102', '105']
+    assert result['rows_updated'] == 3
+    assert result['failed_batches'] == [
+        {'batch': 1, 'error': 'Rate limit exceeded', 'row_ids': ['103', '104']}
+    ]
+
+
+def test_raises_when_no_batch_succeeds(sheet_operations):
+    ops = sheet_operations(COLUMNS, ROWS[:2])
+    fail_batches_with(ops, 101)
+    with pytest.raises(RuntimeError, match='Rate limit exceeded'):
+        ops.update_rows_bulk('1', UPDATES[:2], {'Task': '11'}, batch_size=2)
@@ -44,6 +44,8 @@ interface SmartsheetArgs {
     regex?: boolean;
     whole_word?: boolean;
     include_system?: boolean;
+    context_chars?: number | null;
+    ids_only?: boolean;
   };
 }
 
@@ -406,6 +408,11 @@ class SmartsheetServer {
               items: {
                 type: 'string'
               }
+            },
+            validate: {
+              type: 'boolean',
+              description: 'Check each row exists before deleting. Set to false to skip the lookup and let the API skip missing rows; only rows it confirms as deleted are counted',
+              default: true
             }
           },
           required: ['sheet_id', 'row_ids'],
@@ -451,6 +458,14 @@ class SmartsheetServer {
                 include_system: {
                   type: 'boolean',
                   description: 'Include system-managed columns (default: false)'
+                },
+                context_chars: {
+                  type: ['number', 'null'],
+                  description: 'Characters of context returned on each side of a match (default: 40, null for the whole cell)'
+                },
+                ids_only: {
+                  type: 'boolean',
+                  description: 'Only return matching row IDs, without match details (default: false)'
                 }
               }
             }
@@ -609,6 +624,15 @@ class SmartsheetServer {
                   type: 'number',
                   description: 'Number of rows per batch',
                   default: 500
+                },
+                concurrency: {
+                  type: 'number',
+                  description: 'Batch update requests sent in parallel',
+                  default: 4
+                },
+                maxFailuresRetained: {
+                  type: 'number',
+                  description: 'Keep only this many of the most recent failures in the result (all are kept by default). When set, failuresTruncated in the result says whether any were dropped; failureCount always counts every failure'
                 }
               }
             }
@@ -1251,6 +1275,7 @@ class SmartsheetServer {
       }
       else if (name === 'smartsheet_delete') {
         const row_ids = args.row_ids as string[];
+        const validate = args.validate as boolean | undefined;
         
         if (!row_ids) {
           throw new McpError(
@@ -1259,7 +1284,7 @@ class SmartsheetServer {
           );
         }
         
-        const data = { row_ids };
+        const data = { row_ids, validate };
         const escapedData = JSON.stringify(data).replace(/'/g, "'\\''");
         command += ` --data '${escapedData}'`;
       }